@@ -0,0 +1,74 @@
+"""
+Lookup indexes over constituency and candidate lists.
+
+Built once per data set (the local lists at import, the remote lists whenever they are
+re-fetched) and updated in place as constituencies/candidates are added, so request
+handlers never scan the full lists.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_name(value: str) -> str:
+    return _WHITESPACE_RE.sub(" ", value or "").strip().lower()
+
+
+class ConstituencyIndex:
+    """
+    Maps over one constituency list and one candidate list:
+    constituency by id, candidates by constituency id and by normalized constituency name,
+    and candidate by normalized name. Candidate lists keep the source list order.
+    """
+
+    def __init__(self, constituencies: List[Dict[str, Any]], candidates: List[Dict[str, Any]]):
+        self.rebuild(constituencies, candidates)
+
+    def rebuild(self, constituencies: List[Dict[str, Any]], candidates: List[Dict[str, Any]]) -> None:
+        self.constituency_by_id: Dict[str, Dict[str, Any]] = {}
+        self.candidates_by_constituency_id: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self.candidates_by_constituency_name: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self.candidate_by_name: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+        for constituency in constituencies:
+            self.add_constituency(constituency)
+        for candidate in candidates:
+            self.add_candidate(candidate)
+
+    def add_constituency(self, constituency: Dict[str, Any]) -> None:
+        # First entry wins, like a linear scan would
+        self.constituency_by_id.setdefault(constituency.get("id"), constituency)
+
+    def add_candidate(self, candidate: Dict[str, Any]) -> None:
+        entry = (self._seq, candidate)
+        self._seq += 1
+        constituency_id = candidate.get("constituency_id")
+        if constituency_id:
+            self.candidates_by_constituency_id.setdefault(constituency_id, []).append(entry)
+        name_key = normalize_name(candidate.get("constituency", ""))
+        self.candidates_by_constituency_name.setdefault(name_key, []).append(entry)
+        # Last entry wins, like building a dict over the list would
+        self.candidate_by_name[normalize_name(candidate.get("name", ""))] = candidate
+
+    def constituency(self, constituency_id: str) -> Optional[Dict[str, Any]]:
+        return self.constituency_by_id.get(constituency_id)
+
+    def candidates_in(self, constituency_id: str) -> List[Dict[str, Any]]:
+        return [c for _, c in self.candidates_by_constituency_id.get(constituency_id, [])]
+
+    def candidates_for(self, constituency_id: str, normalized_name: str) -> List[Dict[str, Any]]:
+        """Candidates matching the constituency id or its normalized name, in list order."""
+        by_id = self.candidates_by_constituency_id.get(constituency_id, [])
+        by_name = self.candidates_by_constituency_name.get(normalized_name, [])
+        if not by_name:
+            return [c for _, c in by_id]
+        if not by_id:
+            return [c for _, c in by_name]
+        merged = {seq: c for seq, c in by_id}
+        merged.update(by_name)
+        return [merged[seq] for seq in sorted(merged)]
+
+    def candidate_named(self, normalized_name: str) -> Optional[Dict[str, Any]]:
+        return self.candidate_by_name.get(normalized_name)
@@ -0,0 +1,76 @@
+"""
+Typed, columnar normalization for tables scraped from EC result pages.
+
+EC pages mix Devanagari and ASCII digits and group large numbers lakh-style
+("1,23,456") as well as the western way ("123,456"). Columns whose cells all parse as
+numbers are converted once here, so consumers can sort and aggregate on native values.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Union
+
+_DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+# Plain digits, lakh grouping (1,23,45,678) or thousands grouping (12,345,678)
+_INT_RE = re.compile(r"^[+-]?(?:\d+|\d{1,2}(?:,\d{2})*,\d{3}|\d{1,3}(?:,\d{3})+)$")
+_FLOAT_RE = re.compile(r"^[+-]?(?:\d+|\d{1,3}(?:,\d{2,3})+)\.\d+$")
+
+# Cells EC pages use for "no value yet"; they don't make an otherwise numeric column text
+_PLACEHOLDERS = {"-", "--", "\u2013", "\u2014", "n/a", "na"}
+
+Number = Union[int, float]
+
+
+def _is_blank(value: Optional[str]) -> bool:
+    return not value or value.strip().lower() in _PLACEHOLDERS
+
+
+def parse_number(value: Optional[str]) -> Optional[Number]:
+    """Integer or decimal value of a cell, or None if it isn't a number (or is a placeholder)."""
+    if _is_blank(value):
+        return None
+    text = value.translate(_DEVANAGARI_DIGITS).replace(" ", "").rstrip("%")
+    if _INT_RE.match(text):
+        return int(text.replace(",", ""))
+    if _FLOAT_RE.match(text):
+        return float(text.replace(",", ""))
+    return None
+
+
+def _column_type(cells: List[Optional[str]]) -> str:
+    kind = None
+    for cell in cells:
+        if _is_blank(cell):
+            continue
+        parsed = parse_number(cell)
+        if parsed is None:
+            return "str"
+        if isinstance(parsed, float):
+            kind = "float"
+        elif kind is None:
+            kind = "int"
+    return kind or "str"
+
+
+def normalize_table(headers: List[str], rows: List[List[str]]) -> Dict[str, Any]:
+    """
+    Columnar view of one table: a schema (name and type per column) and one value array
+    per column. Numeric columns hold ints/floats, empty, placeholder ("-", "N/A") or
+    missing cells are None, and ragged rows are padded to the widest row.
+    """
+    width = max([len(headers)] + [len(row) for row in rows])
+    schema: List[Dict[str, str]] = []
+    columns: List[List[Any]] = []
+    for i in range(width):
+        cells = [row[i] if i < len(row) else None for row in rows]
+        kind = _column_type(cells)
+        if kind == "str":
+            values = [cell or None for cell in cells]
+        elif kind == "int":
+            values = [parse_number(cell) for cell in cells]
+        else:
+            values = [None if _is_blank(cell) else float(parse_number(cell)) for cell in cells]
+        name = headers[i] if i < len(headers) and headers[i] else f"column_{i}"
+        schema.append({"name": name, "type": kind})
+        columns.append(values)
+    return {"schema": schema, "columns": columns}
@@ -1,10 +1,13 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Request
 from dotenv import load_dotenv
+from fastapi.responses import StreamingResponse
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError
 import os
 import logging
 from pathlib import Path
+from collections import OrderedDict, deque
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any, Tuple
 import uuid
@@ -13,6 +16,17 @@ import httpx
 import xml.etree.ElementTree as ET
 import asyncio
 import time
+import math
+import json
+import hashlib
+import codecs
+import heapq
+import itertools
+import bisect
+import base64
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 import re
 
@@ -46,6 +60,9 @@ app = FastAPI()
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Long-running loops started on startup, cancelled on shutdown
+BACKGROUND_TASKS: List[asyncio.Task] = []
+
 # ============== MODELS ==============
 
 class Candidate(BaseModel):
@@ -287,6 +304,432 @@ HISTORICAL_DATA = [
     }
 ]
 
+# ============== DATABASE INDEXES ==============
+
+# (collection, key, options)
+DB_INDEXES = [
+    ("votes", "voter_token", {"unique": True}),
+    ("votes", "candidate_id", {}),
+    ("candidates", "id", {}),
+    ("game_scores", "player_id", {}),
+    ("cache_entries", "expires_at", {"expireAfterSeconds": 0}),  # only used by CACHE_BACKEND=mongo
+    ("wiki_summaries", "expires_at", {"expireAfterSeconds": 0}),
+]
+
+# Set once the unique voter_token index is confirmed; until then cast_vote pre-reads for duplicates
+VOTE_TOKEN_INDEX_READY = False
+
+
+async def _ensure_indexes() -> bool:
+    """Create the indexes the hot endpoints rely on. Returns True when all of them exist."""
+    global VOTE_TOKEN_INDEX_READY
+    ok = True
+    for collection, key, options in DB_INDEXES:
+        try:
+            await db[collection].create_index(key, **options)
+        except ConnectionFailure as exc:
+            logger.warning("Mongo unreachable, skipping index bootstrap", exc_info=exc)
+            return False
+        except Exception as exc:
+            # e.g. Mongo down, or legacy duplicate votes blocking the unique index
+            logger.warning("Could not ensure index %s.%s", collection, key, exc_info=exc)
+            ok = False
+            continue
+        if (collection, key) == ("votes", "voter_token"):
+            VOTE_TOKEN_INDEX_READY = True
+    return ok
+
+# ============== LIVE VOTE TALLY ==============
+
+TALLY_RECONCILE_SECONDS = float(os.environ.get("TALLY_RECONCILE_SECONDS", "60"))
+
+
+class VoteTally:
+    """
+    In-process per-candidate vote counters so /results doesn't rescan db.votes.
+    Rebuilt from Mongo at startup, bumped on every successful vote and periodically
+    reconciled against the collection (heals drift from other workers or manual edits).
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.ready = False
+        self.version = 0  # bumped whenever counts change
+        self.last_reconciled: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._rebuild_deltas: Optional[Dict[str, int]] = None  # increments made while a rebuild runs
+
+    def increment(self, candidate_id: str, amount: int = 1) -> None:
+        self.counts[candidate_id] = self.counts.get(candidate_id, 0) + amount
+        self.version += 1
+        if self._rebuild_deltas is not None:
+            self._rebuild_deltas[candidate_id] = self._rebuild_deltas.get(candidate_id, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self.counts)
+
+    async def rebuild(self) -> None:
+        """
+        Replace the counters with a fresh aggregation plus the ballots it can't see yet:
+        those still queued in VOTE_QUEUE and any increments made while it ran. Queue writes
+        are held back meanwhile, so a queued ballot is never counted twice. (A direct-path
+        vote inserted mid-aggregation can be; the next pass corrects it.)
+        """
+        pipeline = [{"$group": {"_id": "$candidate_id", "count": {"$sum": 1}}}]
+        async with VOTE_QUEUE.write_lock:
+            pending = VOTE_QUEUE.pending_counts()
+            self._rebuild_deltas = {}
+            try:
+                counts = {item["_id"]: item["count"] async for item in db.votes.aggregate(pipeline)}
+            finally:
+                deltas, self._rebuild_deltas = self._rebuild_deltas, None
+        for extra in (pending, deltas):
+            for candidate_id, amount in extra.items():
+                counts[candidate_id] = counts.get(candidate_id, 0) + amount
+        counts = {candidate_id: count for candidate_id, count in counts.items() if count}
+        if counts != self.counts:
+            self.counts = counts
+            self.version += 1
+        self.ready = True
+        self.last_reconciled = time.time()
+
+    async def _reconcile_loop(self):
+        while True:
+            await asyncio.sleep(TALLY_RECONCILE_SECONDS)
+            try:
+                await self.rebuild()
+            except Exception as exc:
+                logger.warning("Vote tally reconcile failed", exc_info=exc)
+
+    async def start(self):
+        try:
+            await self.rebuild()
+        except Exception as exc:
+            logger.warning("Vote tally rebuild failed, results will aggregate on demand", exc_info=exc)
+        if self._task is None:
+            self._task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+
+VOTE_TALLY = VoteTally()
+
+
+async def _get_vote_counts() -> Dict[str, int]:
+    """Per-candidate vote counts: live tally when warm, aggregation otherwise, memory when DB is down."""
+    if VOTE_TALLY.ready:
+        counts = VOTE_TALLY.snapshot()
+        for candidate_id, count in IN_MEMORY_VOTES["counts"].items():
+            counts[candidate_id] = counts.get(candidate_id, 0) + count
+        return counts
+    pipeline = [{"$group": {"_id": "$candidate_id", "count": {"$sum": 1}}}]
+    return {item["_id"]: item["count"] async for item in db.votes.aggregate(pipeline)}
+
+# ============== VOTE INGESTION ==============
+
+VOTE_WRITE_BEHIND = os.environ.get("VOTE_WRITE_BEHIND", "1").lower() not in ("0", "false", "no")
+VOTE_BATCH_SIZE = int(os.environ.get("VOTE_BATCH_SIZE", "500"))
+VOTE_BATCH_LINGER_MS = int(os.environ.get("VOTE_BATCH_LINGER_MS", "50"))
+VOTE_FLUSH_RETRY_SECONDS = 1.0
+VOTE_SHUTDOWN_FLUSH_SECONDS = float(os.environ.get("VOTE_SHUTDOWN_FLUSH_SECONDS", "15"))
+# Ballots held in memory while Mongo is unreachable; past this /vote answers 503
+VOTE_QUEUE_MAX_PENDING = int(os.environ.get("VOTE_QUEUE_MAX_PENDING", "50000"))
+
+
+class VoteIngestQueue:
+    """
+    Write-behind ballot pipeline for /vote.
+    Duplicates are rejected against an in-memory token index and accepted ballots are
+    flushed with insert_many(ordered=False) once a batch fills or the linger time passes.
+    The unique index on votes.voter_token is the backstop for tokens this process never saw.
+    """
+
+    def __init__(self, batch_size: int, linger_ms: int, max_pending: int = VOTE_QUEUE_MAX_PENDING):
+        self.batch_size = max(1, batch_size)
+        self.linger = max(0, linger_ms) / 1000
+        self.max_pending = max(self.batch_size, max_pending)
+        self.tokens: Dict[str, str] = {}  # voter_token -> candidate_id
+        self.candidate_ids: set = set()
+        self.running = False
+        self.stats = {
+            "accepted": 0, "flushed": 0, "batches": 0, "duplicates": 0, "failed_flushes": 0, "rejected_full": 0,
+        }
+        self._pending: List[Dict[str, Any]] = []
+        # Held for each batch from dequeue to write; VoteTally.rebuild holds it to freeze the queue
+        self.write_lock = asyncio.Lock()
+        self._has_pending = asyncio.Event()
+        self._batch_full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self):
+        """Start flushing; the token index must already be seeded (see _seed_voter_tokens)."""
+        if not VOTE_TOKEN_INDEX_READY:
+            logger.warning("Unique voter_token index missing, votes will be written directly")
+            return
+        self.candidate_ids = {c["id"] for c in await _get_candidates_safe()}
+        self.running = True
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def full(self) -> bool:
+        """True once max_pending ballots are waiting, i.e. writes have been failing for a while."""
+        return len(self._pending) >= self.max_pending
+
+    def submit(self, doc: Dict[str, Any]) -> bool:
+        """Queue a ballot; returns False if the voter token has already voted."""
+        if doc["voter_token"] in self.tokens:
+            self.stats["duplicates"] += 1
+            return False
+        self.tokens[doc["voter_token"]] = doc["candidate_id"]
+        self._pending.append(doc)
+        self.stats["accepted"] += 1
+        self._has_pending.set()
+        if len(self._pending) >= self.batch_size:
+            self._batch_full.set()
+        return True
+
+    async def _run(self):
+        while not self._stopping:
+            await self._has_pending.wait()
+            if len(self._pending) < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), timeout=self.linger)
+                except asyncio.TimeoutError:
+                    pass
+            if not await self.flush():
+                await asyncio.sleep(VOTE_FLUSH_RETRY_SECONDS)
+
+    async def flush(self) -> bool:
+        """Write out everything pending; returns False if a batch had to be requeued."""
+        while self._pending:
+            async with self.write_lock:
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+                self._sync_events()
+                if not await self._write(batch):
+                    self._pending[:0] = batch
+                    self._sync_events()
+                    return False
+        return True
+
+    def pending_counts(self) -> Dict[str, int]:
+        """Per-candidate count of ballots accepted but not yet written."""
+        counts: Dict[str, int] = {}
+        for doc in self._pending:
+            counts[doc["candidate_id"]] = counts.get(doc["candidate_id"], 0) + 1
+        return counts
+
+    def _sync_events(self):
+        if len(self._pending) < self.batch_size:
+            self._batch_full.clear()
+        else:
+            self._batch_full.set()
+        if self._pending:
+            self._has_pending.set()
+        else:
+            self._has_pending.clear()
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        try:
+            await db.votes.insert_many(batch, ordered=False)
+            inserted = len(batch)
+        except BulkWriteError as exc:
+            inserted = exc.details.get("nInserted", 0)
+            for error in exc.details.get("writeErrors", []):
+                doc = batch[error["index"]]
+                key = str(error.get("keyPattern") or error.get("errmsg", ""))
+                if error.get("code") == 11000 and "voter_token" in key:
+                    # Another worker already stored this token; undo our optimistic count
+                    self.stats["duplicates"] += 1
+                    VOTE_TALLY.increment(doc["candidate_id"], -1)
+                elif error.get("code") == 11000:
+                    inserted += 1  # _id clash: this doc landed on an earlier, interrupted attempt
+                else:
+                    # Never stored: release the token so the voter can retry, and undo the count
+                    logger.error(
+                        "Dropping a vote for %s that failed to insert: %s", doc["candidate_id"], error.get("errmsg")
+                    )
+                    self.tokens.pop(doc["voter_token"], None)
+                    VOTE_TALLY.increment(doc["candidate_id"], -1)
+        except Exception as exc:
+            logger.warning("Vote batch flush failed, will retry", exc_info=exc)
+            self.stats["failed_flushes"] += 1
+            return False
+        self.stats["flushed"] += inserted
+        self.stats["batches"] += 1
+        return True
+
+    async def stop(self):
+        # Let the flusher finish its current batch rather than cancelling it mid-write
+        self._stopping = True
+        if self._task:
+            self._has_pending.set()
+            self._batch_full.set()
+            try:
+                await asyncio.wait_for(self._task, timeout=10)
+            except Exception as exc:
+                logger.warning("Vote flusher did not stop cleanly", exc_info=exc)
+            self._task = None
+        if self.running and self._pending:
+            # Every pending ballot was already acknowledged; keep retrying until the deadline
+            deadline = time.time() + VOTE_SHUTDOWN_FLUSH_SECONDS
+            while not await self.flush() and time.time() < deadline:
+                await asyncio.sleep(VOTE_FLUSH_RETRY_SECONDS)
+            if self._pending:
+                # Counts only: voter tokens are ballot credentials and don't belong in logs
+                logger.error(
+                    "Shutting down with %d unwritten votes, per candidate: %s",
+                    len(self._pending), self.pending_counts(),
+                )
+        self.running = False
+
+
+VOTE_QUEUE = VoteIngestQueue(VOTE_BATCH_SIZE, VOTE_BATCH_LINGER_MS)
+
+# ============== VOTER TOKEN FILTER ==============
+
+VOTER_FILTER_CAPACITY = int(os.environ.get("VOTER_FILTER_CAPACITY", "1000000"))
+VOTER_FILTER_ERROR_RATE = float(os.environ.get("VOTER_FILTER_ERROR_RATE", "0.001"))
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings (blake2b + double hashing).
+    No false negatives; false positives approach error_rate once `capacity` items are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))  # bits
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        added = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self._bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def false_positive_rate(self) -> float:
+        return (1 - math.exp(-self.hash_count * self.count / self.size)) ** self.hash_count
+
+
+# Every token that has voted via this process, the DB at startup or the in-memory fallback.
+# Only trusted for negative answers once seeded from db.votes.
+VOTER_FILTER = BloomFilter(VOTER_FILTER_CAPACITY, VOTER_FILTER_ERROR_RATE)
+VOTER_FILTER_STATS = {"seeded": False, "negatives": 0, "probable_positives": 0, "false_positives": 0}
+
+
+async def _seed_voter_tokens() -> bool:
+    """Single pass over db.votes warming the voter filter and the vote queue's token index."""
+    try:
+        async for doc in db.votes.find({}, {"_id": 0, "voter_token": 1, "candidate_id": 1}):
+            VOTER_FILTER.add(doc["voter_token"])
+            if VOTE_WRITE_BEHIND:
+                VOTE_QUEUE.tokens[doc["voter_token"]] = doc.get("candidate_id")
+    except Exception as exc:
+        logger.warning("Could not seed voter tokens from DB", exc_info=exc)
+        return False
+    VOTER_FILTER_STATS["seeded"] = True
+    return True
+
+# ============== LIVE RESULTS STREAM ==============
+
+RESULTS_STREAM_INTERVAL_MS = int(os.environ.get("RESULTS_STREAM_INTERVAL_MS", "1000"))
+RESULTS_STREAM_HEARTBEAT_SECONDS = 15.0
+
+
+def _results_version() -> Tuple[int, int]:
+    return VOTE_TALLY.version, len(IN_MEMORY_VOTES["by_voter"])
+
+
+class ResultsBroadcaster:
+    """
+    Fans one results computation out to every /results/stream subscriber.
+    Woken by the vote path, publishes at most once per interval and only when counts moved;
+    slow subscribers only ever see the latest snapshot.
+    """
+
+    def __init__(self, interval_ms: int):
+        self.interval = max(0, interval_ms) / 1000
+        self.latest: Optional[Dict[str, Any]] = None
+        self._version: Optional[Tuple[int, int]] = None
+        self._subscribers: set = set()
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        self._changed.set()
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if self.latest is not None and self._version == _results_version():
+            queue.put_nowait(self.latest)
+        else:
+            self._changed.set()
+        self._subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._subscribers.discard(queue)
+
+    def _publish(self, payload: Dict[str, Any]) -> None:
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()  # drop the stale snapshot
+            queue.put_nowait(payload)
+
+    async def _run(self):
+        while self._subscribers:
+            try:
+                # Timeout catches changes that didn't notify (e.g. a tally reconcile)
+                await asyncio.wait_for(self._changed.wait(), timeout=RESULTS_STREAM_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self._changed.clear()
+            version = _results_version()
+            if version != self._version:
+                try:
+                    self.latest = await _build_results()
+                    self._version = version
+                    self._publish(self.latest)
+                except Exception as exc:
+                    logger.warning("Results stream update failed", exc_info=exc)
+            await asyncio.sleep(self.interval)
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+
+RESULTS_BROADCASTER = ResultsBroadcaster(RESULTS_STREAM_INTERVAL_MS)
+
 # ============== ENDPOINTS ==============
 
 @api_router.get("/")
@@ -298,6 +741,7 @@ async def refresh_candidates():
     """Delete and reseed candidates with updated data"""
     await db.candidates.delete_many({})
     await db.candidates.insert_many(CANDIDATES_DATA)
+    VOTE_QUEUE.candidate_ids = {c["id"] for c in CANDIDATES_DATA}
     return {"message": "Candidates refreshed", "count": len(CANDIDATES_DATA)}
 
 async def _get_candidates_safe() -> List[Dict[str, Any]]:
@@ -331,30 +775,57 @@ async def get_candidate(candidate_id: str):
         raise HTTPException(status_code=404, detail="Candidate not found")
     return candidate
 
+def _new_vote_doc(vote: VoteCreate) -> Dict[str, Any]:
+    vote_obj = Vote(
+        candidate_id=vote.candidate_id,
+        voter_token=vote.voter_token
+    )
+    doc = vote_obj.model_dump()
+    doc['timestamp'] = doc['timestamp'].isoformat()
+    return doc
+
 @api_router.post("/vote")
 async def cast_vote(vote: VoteCreate):
     """Cast a vote (anonymous, one vote per browser token)"""
+    # Write-behind path: validated in memory, persisted by the batch flusher
+    if VOTE_QUEUE.running:
+        if vote.candidate_id not in VOTE_QUEUE.candidate_ids:
+            raise HTTPException(status_code=404, detail="Candidate not found")
+        if VOTE_QUEUE.full:
+            # Votes can't be stored right now; refuse rather than hold more unwritten ballots
+            VOTE_QUEUE.stats["rejected_full"] += 1
+            raise HTTPException(
+                status_code=503, detail="Voting is temporarily unavailable, please try again shortly",
+                headers={"Retry-After": "5"},
+            )
+        if not VOTE_QUEUE.submit(_new_vote_doc(vote)):
+            raise HTTPException(status_code=400, detail="You have already voted in this election")
+        VOTE_TALLY.increment(vote.candidate_id)
+        VOTER_FILTER.add(vote.voter_token)
+        RESULTS_BROADCASTER.notify()
+        return {"success": True, "message": "Vote cast successfully!"}
+
     # Try DB-backed voting first
     try:
-        existing_vote = await db.votes.find_one({"voter_token": vote.voter_token})
-        if existing_vote:
-            raise HTTPException(status_code=400, detail="You have already voted in this election")
+        # With the unique index in place the insert itself rejects duplicates
+        if not VOTE_TOKEN_INDEX_READY:
+            existing_vote = await db.votes.find_one({"voter_token": vote.voter_token})
+            if existing_vote:
+                raise HTTPException(status_code=400, detail="You have already voted in this election")
 
         candidate = await db.candidates.find_one({"id": vote.candidate_id})
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate not found")
 
-        vote_obj = Vote(
-            candidate_id=vote.candidate_id,
-            voter_token=vote.voter_token
-        )
-        doc = vote_obj.model_dump()
-        doc['timestamp'] = doc['timestamp'].isoformat()
-
-        await db.votes.insert_one(doc)
+        await db.votes.insert_one(_new_vote_doc(vote))
+        VOTE_TALLY.increment(vote.candidate_id)
+        VOTER_FILTER.add(vote.voter_token)
+        RESULTS_BROADCASTER.notify()
         return {"success": True, "message": "Vote cast successfully!"}
     except HTTPException:
         raise
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="You have already voted in this election")
     except Exception as exc:
         logger.warning("Votes DB unavailable, using in-memory fallback", exc_info=exc)
 
@@ -363,29 +834,46 @@ async def cast_vote(vote: VoteCreate):
         raise HTTPException(status_code=400, detail="You have already voted in this election")
 
     IN_MEMORY_VOTES["by_voter"][vote.voter_token] = vote.candidate_id
+    VOTER_FILTER.add(vote.voter_token)
     IN_MEMORY_VOTES["counts"][vote.candidate_id] = IN_MEMORY_VOTES["counts"].get(vote.candidate_id, 0) + 1
+    RESULTS_BROADCASTER.notify()
 
     return {"success": True, "message": "Vote cast successfully (fallback)"}
 
 @api_router.get("/results")
 async def get_results():
     """Get current election results"""
-    try:
-        # Ensure candidates are seeded
-        count = await db.candidates.count_documents({})
-        if count == 0:
-            await db.candidates.insert_many(CANDIDATES_DATA)
+    return await _build_results()
 
-        candidates = await db.candidates.find({}, {"_id": 0}).to_list(100)
+@api_router.get("/results/stream")
+async def stream_results(request: Request):
+    """Server-Sent Events feed of results snapshots, pushed whenever the counts change"""
+    queue = RESULTS_BROADCASTER.subscribe()
 
-        pipeline = [
-            {"$group": {"_id": "$candidate_id", "count": {"$sum": 1}}}
-        ]
-        vote_counts_cursor = db.votes.aggregate(pipeline)
-        vote_counts = {item["_id"]: item["count"] async for item in vote_counts_cursor}
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=RESULTS_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: results\ndata: {json.dumps(payload)}\n\n"
+        finally:
+            RESULTS_BROADCASTER.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+async def _build_results() -> Dict[str, Any]:
+    candidates = await _get_candidates_safe()
+    try:
+        vote_counts = await _get_vote_counts()
     except Exception as exc:
         logger.warning("Votes DB unavailable, using in-memory results", exc_info=exc)
-        candidates = await _get_candidates_safe()
         vote_counts = IN_MEMORY_VOTES["counts"].copy()
 
     total_votes = sum(vote_counts.values()) if vote_counts else 0
@@ -416,6 +904,14 @@ async def get_results():
 @api_router.get("/check-vote/{voter_token}")
 async def check_vote(voter_token: str):
     """Check if a voter token has already voted"""
+    # Queued ballots may not be in Mongo yet
+    if voter_token in VOTE_QUEUE.tokens:
+        return {"has_voted": True, "candidate_id": VOTE_QUEUE.tokens[voter_token]}
+    # Definite negatives skip the DB entirely
+    if VOTER_FILTER_STATS["seeded"] and voter_token not in VOTER_FILTER:
+        VOTER_FILTER_STATS["negatives"] += 1
+        return {"has_voted": False, "candidate_id": None}
+    VOTER_FILTER_STATS["probable_positives"] += 1
     try:
         existing_vote = await db.votes.find_one({"voter_token": voter_token}, {"_id": 0})
     except Exception as exc:
@@ -424,6 +920,8 @@ async def check_vote(voter_token: str):
         return {"has_voted": bool(candidate_id), "candidate_id": candidate_id}
     if existing_vote:
         return {"has_voted": True, "candidate_id": existing_vote.get("candidate_id")}
+    if VOTER_FILTER_STATS["seeded"] and voter_token not in IN_MEMORY_VOTES["by_voter"]:
+        VOTER_FILTER_STATS["false_positives"] += 1
     return {"has_voted": False, "candidate_id": None}
 
 @api_router.get("/provinces")
@@ -447,10 +945,535 @@ async def get_historical_election(election_id: str):
             return election
     raise HTTPException(status_code=404, detail="Election not found")
 
+#
+# ============== CACHE ==============
+#
+
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory").lower()  # memory | mongo
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "5000"))
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+MONGO_CACHE_RETRY_SECONDS = 30.0
+
+
+CACHE_SIZE_SAMPLE = 16  # container items measured per level; the rest are extrapolated
+
+
+def _approx_size(value: Any) -> int:
+    """
+    Rough JSON-ish size of a value, without encoding it. Containers are sampled
+    (CACHE_SIZE_SAMPLE items per level) so multi-MB payloads cost microseconds on the loop.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        items = value.items()
+        count = len(value)
+        sample = [len(str(k)) + 4 + _approx_size(v) for k, v in itertools.islice(items, CACHE_SIZE_SAMPLE)]
+    elif isinstance(value, (list, tuple, set)):
+        count = len(value)
+        sample = [_approx_size(v) + 2 for v in itertools.islice(value, CACHE_SIZE_SAMPLE)]
+    else:
+        return 8
+    if not sample:
+        return 2
+    return 2 + sum(sample) * count // len(sample)
+
+
+class MemoryCacheBackend:
+    """
+    Process-local LRU store of key -> (stored_at, value).
+    Bounded by entry count and an approximate byte budget (sampled size estimate, see _approx_size).
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._data: "OrderedDict[str, Tuple[float, Any, int]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        self._data.move_to_end(key)
+        return item[0], item[1]
+
+    async def set(self, key: str, value: Any, stored_at: float, ttl: float) -> None:
+        size = _approx_size(value)
+        old = self._data.pop(key, None)
+        if old:
+            self.bytes -= old[2]
+        self._data[key] = (stored_at, value, size)
+        self.bytes += size
+        while len(self._data) > 1 and (len(self._data) > self.max_entries or self.bytes > self.max_bytes):
+            _, evicted = self._data.popitem(last=False)
+            self.bytes -= evicted[2]
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        old = self._data.pop(key, None)
+        if old:
+            self.bytes -= old[2]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "entries": len(self._data),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class MongoCacheBackend:
+    """
+    Mongo-backed store (cache_entries by default) so every worker and restart sees the same
+    warm entries. Mongo's TTL monitor removes expired documents; errors degrade to cache
+    misses, and after one the backend stays out of the way for MONGO_CACHE_RETRY_SECONDS.
+    """
+
+    def __init__(self, collection: str = "cache_entries"):
+        self.collection = collection
+        self.errors = 0
+        self._skip_until = 0.0
+
+    def _available(self) -> bool:
+        return time.time() >= self._skip_until
+
+    def _failed(self, action: str, key: str, exc: Exception) -> None:
+        self.errors += 1
+        self._skip_until = time.time() + MONGO_CACHE_RETRY_SECONDS
+        logger.debug("Cache %s failed for %s", action, key, exc_info=exc)
+
+    async def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        if not self._available():
+            return None
+        try:
+            doc = await db[self.collection].find_one({"_id": key})
+        except Exception as exc:
+            self._failed("read", key, exc)
+            return None
+        if not doc:
+            return None
+        return doc["stored_at"], doc["value"]
+
+    async def set(self, key: str, value: Any, stored_at: float, ttl: float) -> None:
+        if not self._available():
+            return
+        expires_at = datetime.fromtimestamp(stored_at + ttl, tz=timezone.utc)
+        try:
+            await db[self.collection].replace_one(
+                {"_id": key},
+                {"stored_at": stored_at, "expires_at": expires_at, "value": value},
+                upsert=True,
+            )
+        except Exception as exc:
+            self._failed("write", key, exc)
+
+    async def delete(self, key: str) -> None:
+        if not self._available():
+            return
+        try:
+            await db[self.collection].delete_one({"_id": key})
+        except Exception as exc:
+            self._failed("delete", key, exc)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "mongo",
+            "collection": self.collection,
+            "errors": self.errors,
+            "available": self._available(),
+        }
+
+
+class TieredCacheBackend:
+    """
+    Read-through pair of stores: a fast local tier in front of a persistent one.
+    Persistent hits are copied into the local tier (keeping their original stored_at),
+    so entries survive restarts but are only loaded into memory when first asked for.
+    """
+
+    def __init__(self, local, persistent):
+        self.local = local
+        self.persistent = persistent
+        self.promotions = 0
+
+    async def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = await self.local.get(key)
+        if entry is not None:
+            return entry
+        entry = await self.persistent.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            self.promotions += 1
+            # Local retention only matters for LRU here; freshness is judged from stored_at
+            await self.local.set(key, value, stored_at, 0)
+        return entry
+
+    async def set(self, key: str, value: Any, stored_at: float, ttl: float) -> None:
+        await self.local.set(key, value, stored_at, ttl)
+        await self.persistent.set(key, value, stored_at, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.local.delete(key)
+        await self.persistent.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "tiered",
+            "local": self.local.stats(),
+            "persistent": self.persistent.stats(),
+            "promotions": self.promotions,
+        }
+
+
+class SingleFlight:
+    """
+    Collapses concurrent loads of the same key into one in-flight call.
+    The load runs as its own task, so a caller disconnecting doesn't fail the others waiting on it.
+    """
+
+    def __init__(self):
+        self.shared = 0  # callers served by a load someone else started
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def join_or_start(self, key: str, loader) -> Tuple[asyncio.Task, bool]:
+        """The in-flight load of `key` (False), or a new one started with `loader` (True)."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+            return task, False
+        task = asyncio.ensure_future(loader())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task, True
+
+    async def do(self, key: str, loader):
+        task, _ = self.join_or_start(key, loader)
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+class CacheNamespace:
+    """
+    TTL-checked view of the cache backend for one kind of data, with hit/miss counters.
+    With a stale_ttl, expired entries are still served for that long while a background
+    load refreshes them (stale-while-revalidate). `ttl_for(value)` can give individual
+    values a different lifetime than the namespace default (e.g. short-lived negatives).
+    """
+
+    def __init__(self, backend, name: str, ttl: float, stale_ttl: float = 0, ttl_for=None):
+        self.backend = backend
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.ttl_for = ttl_for
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.stale_hits = 0
+        self.refresh_failures = 0
+        self._flights = SingleFlight()
+        self._background: set = set()
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _ttl(self, value: Any) -> float:
+        return self.ttl_for(value) if self.ttl_for else self.ttl
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = await self.backend.get(self._key(key))
+        if entry is None:
+            self.misses += 1
+            return None
+        stored_at, value = entry
+        if time.time() - stored_at >= self._ttl(value):
+            self.expired += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def peek(self, key: str) -> Optional[Any]:
+        """Stored value even if past its TTL (while retained for revalidation), without counting stats."""
+        entry = await self.backend.get(self._key(key))
+        return None if entry is None else entry[1]
+
+    async def age(self, key: str) -> Optional[float]:
+        """Seconds since `key` was stored, or None if it isn't cached."""
+        entry = await self.backend.get(self._key(key))
+        return None if entry is None else time.time() - entry[0]
+
+    async def set(self, key: str, value: Any) -> None:
+        # Retain past the TTL so stale copies remain available for revalidation
+        await self.backend.set(self._key(key), value, time.time(), self._ttl(value) + self.stale_ttl)
+
+    async def get_or_load(self, key: str, loader, refresh: bool = False) -> Any:
+        """Cached value, or the result of `loader()` with at most one load in flight per key."""
+        if not refresh:
+            entry = await self.backend.get(self._key(key))
+            if entry is not None:
+                stored_at, value = entry
+                age = time.time() - stored_at
+                ttl = self._ttl(value)
+                if age < ttl:
+                    self.hits += 1
+                    return value
+                self.expired += 1
+                if age < ttl + self.stale_ttl:
+                    self.stale_hits += 1
+                    self.refresh(key, loader)
+                    return value
+            self.misses += 1
+        return await self._flights.do(key, lambda: self._load(key, loader))
+
+    async def get_or_load_many(self, items: Dict[str, Any], batch_loader) -> Dict[str, Any]:
+        """
+        get_or_load for several keys at once. `items` maps key -> whatever the loader needs.
+        Keys already loading are joined; the rest are claimed in the single-flight and loaded
+        together by `batch_loader({key: item})`, which must return a value for each key, so
+        overlapping single-key loads join the batch instead of fetching again.
+        Returns values for the keys that loaded; per-key failures are omitted.
+        """
+        results: Dict[str, Any] = {}
+        misses: Dict[str, Any] = {}
+        for key, item in items.items():
+            value = await self.get(key)
+            if value is not None:
+                results[key] = value
+            else:
+                misses[key] = item
+        if not misses:
+            return results
+
+        batch: Optional[asyncio.Task] = None
+
+        async def load_one(key: str) -> Any:
+            value = (await asyncio.shield(batch))[key]
+            await self.set(key, value)
+            return value
+
+        tasks: Dict[str, asyncio.Task] = {}
+        claimed: Dict[str, Any] = {}
+        # No await between claiming keys and starting the batch, so nothing can start a
+        # duplicate load in between (and load_one only runs once `batch` is set)
+        for key, item in misses.items():
+            tasks[key], started = self._flights.join_or_start(key, lambda k=key: load_one(k))
+            if started:
+                claimed[key] = item
+        if claimed:
+            # Its own task, like single-key loads: cancelling this caller doesn't strand the
+            # claimed keys' flights, which other callers may be waiting on
+            batch = asyncio.ensure_future(batch_loader(claimed))
+
+        loaded = await asyncio.gather(*[asyncio.shield(task) for task in tasks.values()], return_exceptions=True)
+        for key, value in zip(tasks, loaded):
+            if not isinstance(value, BaseException):
+                results[key] = value
+        return results
+
+    def refresh(self, key: str, loader) -> asyncio.Task:
+        """Reload `key` in the background (joining any load already in flight)."""
+        task = asyncio.ensure_future(self._refresh(key, loader))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _refresh(self, key: str, loader) -> None:
+        try:
+            await self._flights.do(key, lambda: self._load(key, loader))
+        except Exception as exc:
+            self.refresh_failures += 1
+            logger.warning("Background refresh of %s failed", self._key(key), exc_info=exc)
+
+    async def _load(self, key: str, loader) -> Any:
+        value = await loader()
+        await self.set(key, value)
+        return value
+
+    async def delete(self, key: str) -> None:
+        await self.backend.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "coalesced": self._flights.shared,
+            "in_flight": len(self._flights),
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+CACHE_STORE = (
+    MongoCacheBackend() if CACHE_BACKEND == "mongo"
+    else MemoryCacheBackend(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES)
+)
+CACHE_NAMESPACES: Dict[str, CacheNamespace] = {}
+
+
+def _cache_namespace(name: str, ttl: float, stale_ttl: float = 0, backend=None, ttl_for=None) -> CacheNamespace:
+    namespace = CacheNamespace(backend or CACHE_STORE, name, ttl, stale_ttl, ttl_for)
+    CACHE_NAMESPACES[name] = namespace
+    return namespace
+
+
+@api_router.get("/cache/stats")
+async def cache_stats():
+    """Cache size, evictions and per-namespace hit rates"""
+    return {
+        "store": CACHE_STORE.stats(),
+        "namespaces": {
+            name: {**ns.stats(), **({"store": ns.backend.stats()} if ns.backend is not CACHE_STORE else {})}
+            for name, ns in CACHE_NAMESPACES.items()
+        },
+        "upstreams": HTTP_BREAKER.stats(),
+    }
+
+#
+# ============== OUTBOUND HTTP ==============
+#
+
+try:
+    import h2  # noqa: F401 - httpx only negotiates HTTP/2 when h2 is installed
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled client per integration: its own keep-alive pool, connection cap and timeouts
+HTTP_PROFILES: Dict[str, Dict[str, Any]] = {
+    "ec": {
+        "timeout": httpx.Timeout(30.0, connect=10.0),
+        "max_connections": 4,  # result.election.gov.np is fragile, don't pile on
+        # Use a browser-like UA to reduce blocks
+        "headers": {"User-Agent": "Mozilla/5.0 (NepaliBallot; +https://github.com/)"},  # harmless UA
+    },
+    "rss": {"timeout": httpx.Timeout(10.0), "max_connections": 6},
+    "remote": {"timeout": httpx.Timeout(30.0, connect=5.0), "max_connections": 10},
+    "wiki": {"timeout": httpx.Timeout(20.0, connect=5.0), "max_connections": 10},
+    "football": {"timeout": httpx.Timeout(15.0, connect=5.0), "max_connections": 2},
+}
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+HTTP_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+
+HTTP_BREAKER_THRESHOLD = 3  # consecutive failures before a host is short-circuited
+HTTP_BREAKER_BASE_SECONDS = 5.0
+HTTP_BREAKER_MAX_SECONDS = 300.0
+HTTP_BREAKER_PROBE_TIMEOUT_SECONDS = 30.0  # a probe that never reports back frees the slot after this
+
+
+class UpstreamUnavailable(Exception):
+    """Raised instead of calling a host whose circuit is open."""
+
+
+class HostCircuitBreaker:
+    """
+    Per-host failure tracking. After HTTP_BREAKER_THRESHOLD consecutive failures the host
+    is skipped for an exponentially growing backoff (capped). Once it passes the circuit is
+    half-open: exactly one caller is let through as a probe while the rest keep being
+    short-circuited, until the probe's success closes the circuit or its failure reopens it.
+    """
+
+    def __init__(self):
+        self._hosts: Dict[str, Dict[str, float]] = {}
+
+    def _state(self, host: str) -> Dict[str, float]:
+        return self._hosts.setdefault(
+            host, {"failures": 0, "open_until": 0.0, "probe_started": 0.0, "short_circuited": 0}
+        )
+
+    def allow(self, host: str) -> bool:
+        state = self._state(host)
+        now = time.time()
+        tripped = state["failures"] >= HTTP_BREAKER_THRESHOLD
+        probing = now - state["probe_started"] < HTTP_BREAKER_PROBE_TIMEOUT_SECONDS
+        if now < state["open_until"] or (tripped and probing):
+            state["short_circuited"] += 1
+            return False
+        if tripped:
+            state["probe_started"] = now
+        return True
+
+    def check(self, host: str) -> None:
+        if not self.allow(host):
+            raise UpstreamUnavailable(host)
+
+    def record_success(self, host: str) -> None:
+        state = self._state(host)
+        state["failures"] = 0
+        state["open_until"] = 0.0
+        state["probe_started"] = 0.0
+
+    def record_failure(self, host: str) -> None:
+        state = self._state(host)
+        state["failures"] += 1
+        state["probe_started"] = 0.0
+        over = state["failures"] - HTTP_BREAKER_THRESHOLD
+        if over >= 0:
+            backoff = min(HTTP_BREAKER_MAX_SECONDS, HTTP_BREAKER_BASE_SECONDS * (2 ** over))
+            state["open_until"] = time.time() + backoff
+            logger.warning("Circuit open for %s for %.0fs after %d failures", host, backoff, state["failures"])
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            host: {
+                "consecutive_failures": int(state["failures"]),
+                "open": now < state["open_until"],
+                "probing": now - state["probe_started"] < HTTP_BREAKER_PROBE_TIMEOUT_SECONDS,
+                "retry_in_seconds": max(0.0, round(state["open_until"] - now, 1)),
+                "short_circuited": int(state["short_circuited"]),
+            }
+            for host, state in self._hosts.items()
+        }
+
+
+HTTP_BREAKER = HostCircuitBreaker()
+
+
+def _http_client(profile: str) -> httpx.AsyncClient:
+    """Shared AsyncClient for an integration; created on first use (normally at startup)."""
+    http_client = HTTP_CLIENTS.get(profile)
+    if http_client is None or http_client.is_closed:
+        cfg = HTTP_PROFILES[profile]
+        http_client = httpx.AsyncClient(
+            timeout=cfg["timeout"],
+            limits=httpx.Limits(
+                max_connections=cfg["max_connections"],
+                max_keepalive_connections=cfg["max_connections"],
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            headers=cfg.get("headers"),
+        )
+        HTTP_CLIENTS[profile] = http_client
+    return http_client
+
+
+async def _close_http_clients():
+    for http_client in HTTP_CLIENTS.values():
+        await http_client.aclose()
+    HTTP_CLIENTS.clear()
+
 #
 # ============== OFFICIAL ELECTION COMMISSION (EC) ENDPOINTS ==============
 #
 
+from ec_normalize import normalize_table
+
 EC_SOURCES: Dict[str, Dict[str, str]] = {
     # Top-level landing page (useful for users to verify)
     "home": {"label": "EC Results Home", "url": "https://result.election.gov.np/ElectionResult.aspx"},
@@ -463,9 +1486,40 @@ EC_SOURCES: Dict[str, Dict[str, str]] = {
     "pr_party_votes": {"label": "PR Party Vote Status", "url": "https://result.election.gov.np/PRVoteChartResult.aspx"},
 }
 
-# Simple in-memory cache to avoid hammering EC site
-EC_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# Cache parsed pages to avoid hammering EC site
 EC_CACHE_TTL_SECONDS = 300  # 5 minutes
+# Expired pages are served for up to this long while a background fetch replaces them
+EC_CACHE_STALE_SECONDS = int(os.environ.get("EC_CACHE_STALE_SECONDS", "3600"))
+EC_CACHE = _cache_namespace("ec", EC_CACHE_TTL_SECONDS, EC_CACHE_STALE_SECONDS)
+
+# Optional scheduler that re-fetches recently requested EC pages shortly before they expire
+EC_PREFETCH_ENABLED = os.environ.get("EC_PREFETCH", "0").lower() in ("1", "true", "yes")
+EC_PREFETCH_INTERVAL_SECONDS = 30
+EC_PREFETCH_AHEAD_SECONDS = 60
+EC_HOT_WINDOW_SECONDS = 15 * 60
+EC_LAST_REQUESTED: Dict[str, float] = {}  # source_id -> last request time
+
+
+EC_TEXT_MAX_LINES = 120
+
+# HTML parsing is CPU-bound pure Python; it runs on this pool so it never holds the event loop
+EC_PARSE_WORKERS = max(1, int(os.environ.get("EC_PARSE_WORKERS", "2")))
+EC_PARSE_CHUNK_CHARS = 64 * 1024  # decoded text handed to a worker per dispatch
+# Revalidations hold up to this much raw body while hashing, so an unchanged page is never parsed
+EC_HASH_BUFFER_BYTES = int(os.environ.get("EC_HASH_BUFFER_BYTES", str(8 * 1024 * 1024)))
+EC_PARSE_POOL = ThreadPoolExecutor(max_workers=EC_PARSE_WORKERS, thread_name_prefix="ec-parse")
+EC_PARSE_STATS: Dict[str, Any] = {
+    "pages": 0,
+    "early_stops": 0,
+    "chunks": 0,
+    "parse_seconds_total": 0.0,
+    "parse_seconds_max_page": 0.0,
+    "not_modified": 0,  # 304 on a conditional request
+    "unchanged_content": 0,  # 200 with the same body hash, parsing and diffing skipped
+}
+
+# Per source_id: etag, last_modified and content_hash of the last full fetch, plus its payload
+EC_VALIDATORS: Dict[str, Dict[str, Any]] = {}
 
 
 class _HTMLTableParser(HTMLParser):
@@ -522,32 +1576,47 @@ class _HTMLTableParser(HTMLParser):
             self._cell_text_parts.append(data)
 
 
-class _HTMLTextExtractor(HTMLParser):
-    """Extract visible text from HTML (fallback when structured tables aren't available)."""
+class _ECPageParser(_HTMLTableParser):
+    """
+    Single-pass parser for EC pages, fed incrementally as the response streams in.
+    Collects tables plus the visible text lines (deduplicated, capped at `max_lines`) used
+    as a fallback when a page has no tables. With `stop_after_table` set, `done` flips as
+    soon as that table (0-based) has closed so the caller can stop reading.
+    """
 
-    def __init__(self):
+    _SKIP_TAGS = ("script", "style", "head", "noscript")
+
+    def __init__(self, stop_after_table: Optional[int] = None, max_lines: int = EC_TEXT_MAX_LINES):
         super().__init__()
-        self._skip_depth = 0  # script/style/head/noscript
-        self.parts: List[str] = []
+        self.stop_after_table = stop_after_table
+        self.max_lines = max_lines
+        self._skip_depth = 0
+        self._seen_text: set = set()
+        self.text_lines: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self.stop_after_table is not None and len(self.tables) > self.stop_after_table
 
     def handle_starttag(self, tag, attrs):
-        tag = tag.lower()
-        if tag in ("script", "style", "head", "noscript"):
+        super().handle_starttag(tag, attrs)
+        if tag.lower() in self._SKIP_TAGS:
             self._skip_depth += 1
 
     def handle_endtag(self, tag):
-        tag = tag.lower()
-        if tag in ("script", "style", "head", "noscript") and self._skip_depth > 0:
+        super().handle_endtag(tag)
+        if tag.lower() in self._SKIP_TAGS and self._skip_depth > 0:
             self._skip_depth -= 1
 
     def handle_data(self, data):
-        if self._skip_depth > 0:
-            return
-        if not data:
+        super().handle_data(data)
+        # Text is only a fallback, so stop collecting once a table has been found
+        if self._skip_depth > 0 or self.tables or len(self.text_lines) >= self.max_lines:
             return
         txt = " ".join(data.split())
-        if txt:
-            self.parts.append(txt)
+        if txt and txt not in self._seen_text:
+            self._seen_text.add(txt)
+            self.text_lines.append(txt)
 
 
 def _tables_to_structured(tables: List[List[List[str]]]) -> List[Dict[str, Any]]:
@@ -558,55 +1627,154 @@ def _tables_to_structured(tables: List[List[List[str]]]) -> List[Dict[str, Any]]
         # Heuristic: treat first row as headers if it has more than one cell and looks header-like
         headers = t[0]
         rows = t[1:] if len(t) > 1 else []
-        structured.append({"headers": headers, "rows": rows})
+        # Typed per-column arrays alongside the raw rows, so vote counts arrive as ints
+        structured.append({"headers": headers, "rows": rows, **normalize_table(headers, rows)})
     return structured
 
 
-async def _fetch_ec_html(url: str) -> str:
-    # Use a browser-like UA to reduce blocks
-    headers = {"User-Agent": "Mozilla/5.0 (NepaliBallot; +https://github.com/)"}  # harmless UA
-    timeout = httpx.Timeout(30.0)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, headers=headers) as client:
-        # Basic retry for transient TLS/handshake slowness
-        for attempt in (1, 2):
-            try:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                content_type = (resp.headers.get("content-type") or "").lower()
-                charset = "utf-8"
-                if "charset=" in content_type:
-                    charset = content_type.split("charset=", 1)[1].split(";", 1)[0].strip() or "utf-8"
-                try:
-                    return resp.content.decode(charset, errors="replace")
-                except Exception:
-                    # Fallback for odd/misleading charset headers
-                    return resp.content.decode("utf-8", errors="replace")
-            except Exception:
-                if attempt == 2:
-                    raise
-                await asyncio.sleep(0.4)
-    raise RuntimeError("Unreachable")
+def _response_decoder(resp: httpx.Response):
+    content_type = (resp.headers.get("content-type") or "").lower()
+    charset = "utf-8"
+    if "charset=" in content_type:
+        charset = content_type.split("charset=", 1)[1].split(";", 1)[0].strip() or "utf-8"
+    try:
+        return codecs.getincrementaldecoder(charset)(errors="replace")
+    except LookupError:
+        # Fallback for odd/misleading charset headers
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
 
 
-def _extract_tables(html: str) -> List[Dict[str, Any]]:
-    parser = _HTMLTableParser()
-    parser.feed(html)
-    return _tables_to_structured(parser.tables)
+def _timed_feed(parser: _ECPageParser, text: str, final: bool = False) -> float:
+    started = time.perf_counter()
+    parser.feed(text)
+    if final:
+        parser.close()
+    return time.perf_counter() - started
 
 
-def _extract_text_lines(html: str, max_lines: int = 120) -> List[str]:
-    extractor = _HTMLTextExtractor()
-    extractor.feed(html)
-    lines: List[str] = []
-    seen = set()
-    for part in extractor.parts:
-        if part in seen:
-            continue
-        seen.add(part)
-        lines.append(part)
-        if len(lines) >= max_lines:
-            break
-    return lines
+class _ECParseJob:
+    """
+    Feeds one page's decoded text to its parser on EC_PARSE_POOL, batching stream chunks
+    into EC_PARSE_CHUNK_CHARS dispatches. One dispatch stays in flight while the caller
+    reads the next chunks; a new one waits for it first, so the parser is never touched by
+    two threads at once (and `parser.done` may lag by one dispatch). The parser only ever
+    lives in this process, so results need no serialization.
+    """
+
+    def __init__(self, stop_after_table: Optional[int] = None):
+        self.parser = _ECPageParser(stop_after_table)
+        self.parse_seconds = 0.0
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._inflight: Optional[asyncio.Future] = None
+
+    async def drain(self) -> None:
+        """Wait for the dispatch in flight, if any."""
+        if self._inflight is not None:
+            inflight, self._inflight = self._inflight, None
+            self.parse_seconds += await inflight
+
+    async def _dispatch(self, final: bool = False) -> None:
+        await self.drain()
+        text = "".join(self._pending)
+        self._pending = []
+        self._pending_chars = 0
+        if self.parser.done:
+            return
+        loop = asyncio.get_running_loop()
+        self._inflight = loop.run_in_executor(EC_PARSE_POOL, _timed_feed, self.parser, text, final)
+        EC_PARSE_STATS["chunks"] += 1
+
+    async def feed(self, text: str) -> None:
+        if text:
+            self._pending.append(text)
+            self._pending_chars += len(text)
+        if self._pending_chars >= EC_PARSE_CHUNK_CHARS:
+            await self._dispatch()
+
+    async def finish(self) -> _ECPageParser:
+        await self.drain()
+        if not self.parser.done:
+            await self._dispatch(final=True)
+            await self.drain()
+        else:
+            EC_PARSE_STATS["early_stops"] += 1
+        EC_PARSE_STATS["pages"] += 1
+        EC_PARSE_STATS["parse_seconds_total"] += self.parse_seconds
+        EC_PARSE_STATS["parse_seconds_max_page"] = max(EC_PARSE_STATS["parse_seconds_max_page"], self.parse_seconds)
+        return self.parser
+
+
+async def _fetch_ec_page(
+    url: str,
+    stop_after_table: Optional[int] = None,
+    validators: Optional[Dict[str, Any]] = None,
+) -> Tuple[Optional[_ECPageParser], Dict[str, Any]]:
+    """
+    Stream an EC page through `_ECPageParser` chunk by chunk, so the full document is
+    never buffered and reading stops soon after the requested table is complete. Each
+    batch parses on EC_PARSE_POOL while the next one downloads (see `_ECParseJob`).
+
+    With `validators` from a previous fetch the request is conditional, and the parser
+    comes back as None when the page is unchanged (304, or a body with the same hash).
+    Revalidations hold the raw body while hashing it and only parse on a mismatch; a body
+    past EC_HASH_BUFFER_BYTES falls back to streaming the rest through the parser.
+    Returns the parser and the validators for this response.
+    """
+    client = _http_client("ec")
+    headers: Dict[str, str] = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    known_hash = (validators or {}).get("content_hash")
+    # Basic retry for transient TLS/handshake slowness
+    for attempt in (1, 2):
+        job = _ECParseJob(stop_after_table)
+        digest = hashlib.sha256()
+        try:
+            async with client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code == 304 and validators:
+                    EC_PARSE_STATS["not_modified"] += 1
+                    return None, validators
+                resp.raise_for_status()
+                fresh: Dict[str, Any] = {
+                    "etag": resp.headers.get("etag"),
+                    "last_modified": resp.headers.get("last-modified"),
+                }
+                decoder = _response_decoder(resp)
+                held: Optional[List[bytes]] = [] if known_hash else None
+                held_bytes = 0
+                async for chunk in resp.aiter_bytes():
+                    digest.update(chunk)
+                    if held is not None:
+                        held.append(chunk)
+                        held_bytes += len(chunk)
+                        if held_bytes <= EC_HASH_BUFFER_BYTES:
+                            continue
+                        # Too large to hold: parse what's buffered and stream the rest
+                        chunk = b"".join(held)
+                        held = None
+                    await job.feed(decoder.decode(chunk))
+                    if job.parser.done:
+                        break
+                else:
+                    fresh["content_hash"] = digest.hexdigest()
+                    if known_hash and fresh["content_hash"] == known_hash:
+                        await job.drain()
+                        EC_PARSE_STATS["unchanged_content"] += 1
+                        EC_PARSE_STATS["parse_seconds_total"] += job.parse_seconds
+                        return None, fresh
+                    for chunk in held or ():
+                        await job.feed(decoder.decode(chunk))
+                    await job.feed(decoder.decode(b"", final=True))
+            return await job.finish(), fresh
+        except Exception:
+            if attempt == 2:
+                raise
+            await asyncio.sleep(0.4)
+    raise RuntimeError("Unreachable")
 
 
 @api_router.get("/ec/sources")
@@ -620,32 +1788,85 @@ async def ec_sources():
 
 
 @api_router.get("/ec/tables/{source_id}")
-async def ec_tables(source_id: str, refresh: bool = False):
+async def ec_tables(source_id: str, refresh: bool = False, table: Optional[int] = None):
     """
     Fetch and parse tables from an Election Commission results page.
     Returns normalized tables for frontend display.
+    With `table` set, only that table (0-based) is returned and the page is read just
+    far enough to complete it, unless the full page is already cached. An index past the
+    page's last table is a 404; a page without tables returns its text as usual.
     """
     if source_id not in EC_SOURCES:
         raise HTTPException(status_code=404, detail="Unknown EC source_id")
+    if table is not None and table < 0:
+        raise HTTPException(status_code=400, detail="table must be >= 0")
+
+    EC_LAST_REQUESTED[source_id] = time.time()
+    if table is None:
+        return await EC_CACHE.get_or_load(source_id, lambda: _load_ec_source(source_id), refresh=refresh)
+
+    full = None if refresh else await EC_CACHE.get(source_id)
+    if full is not None:
+        return _select_ec_table(full, table)
+    partial = await EC_CACHE.get_or_load(
+        f"{source_id}#table{table}", lambda: _load_ec_source(source_id, table), refresh=refresh
+    )
+    return _select_ec_table(partial, table)
+
+
+@api_router.get("/ec/parse-stats")
+async def ec_parse_stats():
+    """Worker pool size and cumulative parse timings for EC pages"""
+    pages = EC_PARSE_STATS["pages"]
+    return {
+        "workers": EC_PARSE_WORKERS,
+        **EC_PARSE_STATS,
+        "parse_seconds_avg_page": round(EC_PARSE_STATS["parse_seconds_total"] / pages, 4) if pages else 0.0,
+    }
+
+
+def _select_ec_table(payload: Dict[str, Any], table: int) -> Dict[str, Any]:
+    tables = payload.get("tables") or []
+    if not tables:
+        return {**payload, "table_index": table}
+    if table >= len(tables):
+        raise HTTPException(status_code=404, detail=f"Page has {len(tables)} tables, no table {table}")
+    return {**payload, "tables": tables[table:table + 1], "table_index": table}
 
-    now = time.time()
-    if not refresh:
-        cached = EC_CACHE.get(source_id)
-        if cached:
-            ts, data = cached
-            if now - ts < EC_CACHE_TTL_SECONDS:
-                return data
 
+async def _ec_prefetch_loop():
+    """Keep hot EC pages warm so requests never land on an expired entry."""
+    while True:
+        await asyncio.sleep(EC_PREFETCH_INTERVAL_SECONDS)
+        now = time.time()
+        for source_id, last_requested in list(EC_LAST_REQUESTED.items()):
+            if now - last_requested > EC_HOT_WINDOW_SECONDS:
+                continue
+            age = await EC_CACHE.age(source_id)
+            if age is None or age >= EC_CACHE_TTL_SECONDS - EC_PREFETCH_AHEAD_SECONDS:
+                # One source at a time to stay gentle on the EC site
+                await EC_CACHE.refresh(source_id, lambda sid=source_id: _load_ec_source(sid))
+
+
+async def _load_ec_source(source_id: str, table: Optional[int] = None) -> Dict[str, Any]:
     url = EC_SOURCES[source_id]["url"]
+    # Single-table loads stop early and never see the whole body, so only full loads revalidate
+    previous = EC_VALIDATORS.get(source_id) if table is None else None
     try:
-        html = await _fetch_ec_html(url)
+        parser, validators = await _fetch_ec_page(url, stop_after_table=table, validators=previous)
     except Exception as e:
         logger.exception("EC fetch failed: %s", e)
         raise HTTPException(status_code=502, detail="Failed to fetch official EC data")
 
-    tables = _extract_tables(html)
+    now = datetime.now(timezone.utc).isoformat()
+    if parser is None:
+        payload = {**previous["payload"], "fetched_at": now}
+        EC_VALIDATORS[source_id] = {**validators, "payload": payload}
+        return payload
+
+    tables = await asyncio.get_running_loop().run_in_executor(EC_PARSE_POOL, _tables_to_structured, parser.tables)
     content_type = "tables" if tables else "text"
-    text_lines: List[str] = _extract_text_lines(html) if not tables else []
+    text_lines: List[str] = parser.text_lines if not tables else []
 
     payload = {
         "source_id": source_id,
@@ -654,13 +1875,133 @@ async def ec_tables(source_id: str, refresh: bool = False):
         "content_type": content_type,
         "tables": tables,
         "text_lines": text_lines,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": now,
+        "changed_at": now,  # last fetch whose content differed; fetched_at alone moves on every check
         "cache_ttl_seconds": EC_CACHE_TTL_SECONDS,
     }
-    EC_CACHE[source_id] = (now, payload)
+    if table is not None:
+        # Cached as read (tables up to `table`); the endpoint picks the one asked for
+        return payload
+    EC_VALIDATORS[source_id] = {**validators, "payload": payload}
+    EC_CHANGE_LOG.observe(source_id, tables, now)
     return payload
 
 
+# Optional poller that refreshes every EC source on its own interval, independent of traffic
+EC_POLL_ENABLED = os.environ.get("EC_POLL", "0").lower() in ("1", "true", "yes")
+EC_POLL_DEFAULT_SECONDS = int(os.environ.get("EC_POLL_DEFAULT_SECONDS", "120"))
+EC_POLL_INTERVALS: Dict[str, int] = {
+    # Party tallies move fastest during counting; the landing page barely changes
+    "fptp_party_status": 60,
+    "pr_party_votes": 60,
+    "hor_fptp_detail": 90,
+    "home": 600,
+}
+EC_CHANGES_MAX = int(os.environ.get("EC_CHANGES_MAX", "5000"))
+
+
+class ECChangeLog:
+    """
+    Row-level diffs between successive parses of each EC source, kept in a bounded ring
+    buffer. Rows are keyed by their first cell (with a #n suffix for repeats) within each
+    table; the first parse of a source is the baseline and records no changes.
+    """
+
+    def __init__(self, maxlen: int = EC_CHANGES_MAX):
+        self._changes: deque = deque(maxlen=maxlen)
+        self.seq = 0
+        self._snapshots: Dict[str, List[Tuple[List[str], Dict[str, List[str]]]]] = {}
+
+    @staticmethod
+    def _index(tables: List[Dict[str, Any]]) -> List[Tuple[List[str], Dict[str, List[str]]]]:
+        indexed = []
+        for t in tables:
+            rows: Dict[str, List[str]] = {}
+            for row in t.get("rows") or []:
+                base = row[0] if row else ""
+                key, n = base, 1
+                while key in rows:
+                    n += 1
+                    key = f"{base}#{n}"
+                rows[key] = row
+            indexed.append((t.get("headers") or [], rows))
+        return indexed
+
+    def _append(self, change: Dict[str, Any]) -> None:
+        self.seq += 1
+        self._changes.append({"seq": self.seq, **change})
+
+    def observe(self, source_id: str, tables: List[Dict[str, Any]], detected_at: str) -> int:
+        """Diff `tables` against the last snapshot of `source_id`; returns how many changes were recorded."""
+        current = self._index(tables)
+        previous = self._snapshots.get(source_id)
+        self._snapshots[source_id] = current
+        if previous is None:
+            return 0
+        before = self.seq
+        for i in range(max(len(previous), len(current))):
+            base = {"source_id": source_id, "table": i, "detected_at": detected_at}
+            old = previous[i] if i < len(previous) else None
+            new = current[i] if i < len(current) else None
+            if old is None or new is None or old[0] != new[0]:
+                # Table appeared, vanished or changed shape: clients should refetch it whole
+                self._append({**base, "type": "table_reset", "headers": new[0] if new else None})
+                continue
+            old_rows, new_rows = old[1], new[1]
+            for key, row in new_rows.items():
+                prior = old_rows.get(key)
+                if prior is None:
+                    self._append({**base, "type": "added", "key": key, "row": row})
+                elif prior != row:
+                    self._append({**base, "type": "changed", "key": key, "row": row, "previous": prior})
+            for key, prior in old_rows.items():
+                if key not in new_rows:
+                    self._append({**base, "type": "removed", "key": key, "previous": prior})
+        return self.seq - before
+
+    def since(self, seq: int, source_id: Optional[str] = None, limit: int = 500) -> Dict[str, Any]:
+        oldest = self._changes[0]["seq"] if self._changes else self.seq + 1
+        # A cursor older than the buffer (or from before a restart) can't be served as a delta
+        reset = seq < oldest - 1 or seq > self.seq
+        changes = [
+            c for c in self._changes
+            if c["seq"] > seq and (source_id is None or c["source_id"] == source_id)
+        ][:limit]
+        return {
+            "changes": changes,
+            "latest_seq": self.seq,
+            "next_since": changes[-1]["seq"] if changes else self.seq,
+            "reset": reset,
+        }
+
+
+EC_CHANGE_LOG = ECChangeLog()
+
+
+async def _ec_poll_loop():
+    """Refresh each EC source on its EC_POLL_INTERVALS cadence, one at a time."""
+    next_due = {source_id: 0.0 for source_id in EC_SOURCES}
+    while True:
+        for source_id, due in next_due.items():
+            if due > time.time():
+                continue
+            await EC_CACHE.refresh(source_id, lambda sid=source_id: _load_ec_source(sid))
+            next_due[source_id] = time.time() + EC_POLL_INTERVALS.get(source_id, EC_POLL_DEFAULT_SECONDS)
+        await asyncio.sleep(max(1.0, min(next_due.values()) - time.time()))
+
+
+@api_router.get("/ec/changes")
+async def ec_changes(since: int = 0, source_id: Optional[str] = None, limit: int = 500):
+    """
+    Row-level changes to EC tables after sequence number `since`.
+    Poll with the returned `next_since`; `reset: true` means the cursor fell out of the
+    buffer and the affected tables should be refetched whole.
+    """
+    if source_id is not None and source_id not in EC_SOURCES:
+        raise HTTPException(status_code=404, detail="Unknown EC source_id")
+    return {"polling": EC_POLL_ENABLED, **EC_CHANGE_LOG.since(since, source_id, max(1, min(limit, 5000)))}
+
+
 @api_router.get("/stats")
 async def get_stats():
     """Get overall statistics"""
@@ -673,6 +2014,20 @@ async def get_stats():
         "election_status": "active"
     }
 
+@api_router.get("/stats/voter-filter")
+async def get_voter_filter_stats():
+    """Size and accuracy of the in-memory voter token filter used by /check-vote"""
+    return {
+        "capacity": VOTER_FILTER.capacity,
+        "size_bits": VOTER_FILTER.size,
+        "size_bytes": len(VOTER_FILTER._bits),
+        "hash_count": VOTER_FILTER.hash_count,
+        "items": VOTER_FILTER.count,
+        "target_false_positive_rate": VOTER_FILTER.error_rate,
+        "estimated_false_positive_rate": round(VOTER_FILTER.false_positive_rate(), 6),
+        **VOTER_FILTER_STATS,
+    }
+
 # ============== GAME ENDPOINTS ==============
 
 @api_router.get("/games/quiz-questions")
@@ -714,8 +2069,7 @@ async def get_candidate_cards():
     candidates = await db.candidates.find({}, {"_id": 0}).to_list(100)
     
     # Get vote counts
-    pipeline = [{"$group": {"_id": "$candidate_id", "count": {"$sum": 1}}}]
-    vote_counts = {item["_id"]: item["count"] async for item in db.votes.aggregate(pipeline)}
+    vote_counts = await _get_vote_counts()
     
     cards = []
     for c in candidates:
@@ -781,87 +2135,392 @@ async def get_leaderboard():
 # ============== NEWS ENDPOINTS ==============
 
 RSS_FEEDS = [
-    {"id": "bbc", "name": "BBC Nepali", "url": "https://feeds.bbci.co.uk/nepali/rss.xml", "color": "#BB1919"},
-    {"id": "ekantipur", "name": "Ekantipur", "url": "https://ekantipur.com/rss", "color": "#1E40AF"},
-    {"id": "kathmandu", "name": "Kathmandu Post", "url": "https://kathmandupost.com/rss", "color": "#DC2626"},
+    {"id": "bbc", "name": "BBC Nepali", "url": "https://feeds.bbci.co.uk/nepali/rss.xml", "color": "#BB1919", "ttl_seconds": 300},
+    {"id": "ekantipur", "name": "Ekantipur", "url": "https://ekantipur.com/rss", "color": "#1E40AF", "ttl_seconds": 600},
+    {"id": "kathmandu", "name": "Kathmandu Post", "url": "https://kathmandupost.com/rss", "color": "#DC2626", "ttl_seconds": 600},
 ]
+NEWS_DEFAULT_TTL_SECONDS = 300
+NEWS_ERROR_RETRY_SECONDS = 60
+NEWS_REFRESH_TICK_SECONDS = 15
+# A response never waits longer than this on feeds; laggards keep fetching in the background
+NEWS_RESPONSE_DEADLINE_SECONDS = float(os.environ.get("NEWS_RESPONSE_DEADLINE_SECONDS", "2.5"))
+NEWS_FEED_TIMEOUT_SECONDS = 10.0  # per-feed fetch deadline, overridable with a feed's timeout_seconds
+# Last good copy of each feed, so a cold start (with CACHE_BACKEND=mongo) serves something at once
+NEWS_LAST_GOOD_SECONDS = 24 * 60 * 60
+NEWS_CACHE = _cache_namespace("news", NEWS_LAST_GOOD_SECONDS)
+NEWS_PAGE_DEFAULT_LIMIT = 50
+NEWS_PAGE_MAX_LIMIT = 100
+
+def _parse_feed_date(value: str) -> Optional[float]:
+    """Timestamp for an RSS (RFC 822) or Atom (ISO 8601) date, or None if unparseable"""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def _normalize_article_link(link: str) -> str:
+    """Link without scheme, www., tracking parameters, fragment or trailing slash"""
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+def _article_id(link: str, title: str) -> str:
+    """
+    Content hash of the normalized title and link, stable across processes. Items whose
+    title and link match after normalization (case/whitespace; scheme, www., utm_* params)
+    share an id and are deduplicated, including when two feeds carry them.
+    """
+    basis = " ".join(title.split()).casefold() + "\n" + _normalize_article_link(link)
+    return hashlib.blake2b(basis.encode("utf-8"), digest_size=8).hexdigest()
+
+def _article_sort_key(article: dict) -> Tuple[float, str]:
+    return (-article["published_ts"], article["id"])
+
+def _encode_news_cursor(key: Tuple[float, str]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
 
-async def fetch_rss_feed(feed: dict) -> List[dict]:
-    """Fetch and parse RSS feed"""
-    articles = []
+def _decode_news_cursor(cursor: str) -> Tuple[float, str]:
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(feed["url"], follow_redirects=True)
-            if response.status_code == 200:
-                root = ET.fromstring(response.content)
-                # Handle both RSS and Atom feeds
-                items = root.findall('.//item') or root.findall('.//{http://www.w3.org/2005/Atom}entry')
-                
-                for item in items[:10]:  # Limit to 10 items per feed
-                    title = item.findtext('title') or item.findtext('{http://www.w3.org/2005/Atom}title') or ''
-                    link = item.findtext('link') or ''
-                    if not link:
-                        link_elem = item.find('{http://www.w3.org/2005/Atom}link')
-                        if link_elem is not None:
-                            link = link_elem.get('href', '')
-                    
-                    description = item.findtext('description') or item.findtext('{http://www.w3.org/2005/Atom}summary') or ''
-                    pub_date = item.findtext('pubDate') or item.findtext('{http://www.w3.org/2005/Atom}published') or ''
-                    
-                    # Try to get image
-                    image = None
-                    media_content = item.find('{http://search.yahoo.com/mrss/}content')
-                    if media_content is not None:
-                        image = media_content.get('url')
-                    enclosure = item.find('enclosure')
-                    if enclosure is not None and not image:
-                        image = enclosure.get('url')
-                    
-                    # Clean description (remove HTML)
-                    import re
-                    clean_desc = re.sub('<[^<]+?>', '', description)[:200] if description else ''
-                    
-                    articles.append({
-                        "id": f"{feed['id']}_{hash(title) % 10000}",
-                        "title": title.strip(),
-                        "link": link.strip(),
-                        "description": clean_desc.strip(),
-                        "time": pub_date[:25] if pub_date else "Recent",
-                        "source": feed["name"],
-                        "sourceId": feed["id"],
-                        "sourceColor": feed["color"],
-                        "image": image
-                    })
-    except Exception as e:
-        logging.error(f"Failed to fetch RSS from {feed['name']}: {e}")
-    return articles
+        neg_ts, article_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return (float(neg_ts), str(article_id))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+NEWS_ITEMS_PER_FEED = 10
+NEWS_DESCRIPTION_CHARS = 200
+_HTML_TAG_RE = re.compile(r"<[^<]+?>")
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_MRSS = "{http://search.yahoo.com/mrss/}"
+
+
+def _clean_description(description: str) -> str:
+    """
+    Remove HTML, scanning tag by tag only until enough text for the output is collected,
+    so long descriptions stop early but never mid-tag.
+    """
+    if not description:
+        return ''
+    parts: List[str] = []
+    collected = 0
+    pos = 0
+    for match in _HTML_TAG_RE.finditer(description):
+        text = description[pos:match.start()]
+        parts.append(text)
+        collected += len(text)
+        pos = match.end()
+        if collected >= NEWS_DESCRIPTION_CHARS:
+            break
+    else:
+        parts.append(description[pos:])
+    return ''.join(parts)[:NEWS_DESCRIPTION_CHARS].strip()
+
+
+def _rss_item_to_article(item: ET.Element, feed: dict) -> dict:
+    title = item.findtext('title') or item.findtext(f'{_ATOM}title') or ''
+    link = item.findtext('link') or ''
+    if not link:
+        link_elem = item.find(f'{_ATOM}link')
+        if link_elem is not None:
+            link = link_elem.get('href', '')
+
+    description = item.findtext('description') or item.findtext(f'{_ATOM}summary') or ''
+    pub_date = item.findtext('pubDate') or item.findtext(f'{_ATOM}published') or ''
+
+    # Try to get image
+    image = None
+    media_content = item.find(f'{_MRSS}content')
+    if media_content is not None:
+        image = media_content.get('url')
+    enclosure = item.find('enclosure')
+    if enclosure is not None and not image:
+        image = enclosure.get('url')
+
+    return {
+        "id": _article_id(link, title),
+        "title": title.strip(),
+        "link": link.strip(),
+        "description": _clean_description(description),
+        "time": pub_date[:25] if pub_date else "Recent",
+        "source": feed["name"],
+        "sourceId": feed["id"],
+        "sourceColor": feed["color"],
+        "image": image,
+        # None until the aggregator stamps undated items with their first-seen time
+        "published_ts": _parse_feed_date(pub_date),
+    }
+
+
+class _FeedStreamParser:
+    """
+    Incremental RSS/Atom parser fed raw bytes as they stream in. Each <item>/<entry> is
+    turned into an article as soon as it closes and then cleared, and `done` is set once
+    `max_items` are collected so the caller can stop reading the feed.
+    """
+
+    def __init__(self, feed: dict, max_items: int = NEWS_ITEMS_PER_FEED):
+        self.feed = feed
+        self.max_items = max_items
+        self.articles: List[dict] = []
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    @property
+    def done(self) -> bool:
+        return len(self.articles) >= self.max_items
+
+    def _drain(self) -> None:
+        for _, elem in self._parser.read_events():
+            if elem.tag not in ("item", f"{_ATOM}entry") or self.done:
+                continue
+            self.articles.append(_rss_item_to_article(elem, self.feed))
+            elem.clear()
+
+    def feed_bytes(self, data: bytes) -> None:
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> None:
+        self._parser.close()
+        self._drain()
+
+
+async def _read_rss_feed(response: httpx.Response, feed: dict) -> List[dict]:
+    """Parse a streamed feed response, reading no further than its first NEWS_ITEMS_PER_FEED items"""
+    parser = _FeedStreamParser(feed)
+    async for chunk in response.aiter_bytes():
+        parser.feed_bytes(chunk)
+        if parser.done:
+            return parser.articles
+    parser.close()
+    return parser.articles
+
+
+class NewsAggregator:
+    """
+    Keeps each feed's parsed articles in memory and serves the merged list from there.
+    Feeds are revalidated with conditional GETs once their TTL passes, by a background loop
+    started on the first request; a failed refresh keeps the last good articles.
+
+    Each feed's articles are stored sorted newest first, and the timeline is a k-way merge
+    of those lists (deduplicated by article id) redone only when a feed's content changes.
+
+    Only a cold start waits on the network, and never past NEWS_RESPONSE_DEADLINE_SECONDS:
+    feeds still loading by then are answered from their last good copy in NEWS_CACHE, if
+    any, while the fetch carries on in the background.
+    """
+
+    def __init__(self, feeds: List[dict]):
+        self.feeds = feeds
+        self._state: Dict[str, Dict[str, Any]] = {
+            feed["id"]: {
+                "articles": None, "etag": None, "last_modified": None,
+                "checked_at": 0.0, "fetched_at": None, "restored": False, "error": None,
+            }
+            for feed in feeds
+        }
+        self._restore_task: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.merged: List[dict] = []
+        self._merged_keys: List[Tuple[float, str]] = []
+        self._first_seen: Dict[str, float] = {}
+        self.updated_at: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ttl(self, feed: dict) -> float:
+        return feed.get("ttl_seconds", NEWS_DEFAULT_TTL_SECONDS)
+
+    def _due(self, feed: dict) -> bool:
+        state = self._state[feed["id"]]
+        ttl = NEWS_ERROR_RETRY_SECONDS if state["error"] else self._ttl(feed)
+        return time.time() - state["checked_at"] >= ttl
+
+    def refresh(self, feed: dict) -> asyncio.Task:
+        """Revalidate one feed, joining a refresh already in flight."""
+        task = self._inflight.get(feed["id"])
+        if task is None or task.done():
+            task = asyncio.create_task(self._refresh(feed))
+            self._inflight[feed["id"]] = task
+        return task
+
+    async def _refresh(self, feed: dict) -> None:
+        state = self._state[feed["id"]]
+        headers: Dict[str, str] = {}
+        if state["articles"] is not None:
+            if state["etag"]:
+                headers["If-None-Match"] = state["etag"]
+            if state["last_modified"]:
+                headers["If-Modified-Since"] = state["last_modified"]
+        try:
+            async with _http_client("rss").stream(
+                "GET", feed["url"], headers=headers, timeout=feed.get("timeout_seconds", NEWS_FEED_TIMEOUT_SECONDS)
+            ) as response:
+                if response.status_code != 304:
+                    response.raise_for_status()
+                    state["articles"] = self._ingest(await _read_rss_feed(response, feed))
+                    state["etag"] = response.headers.get("etag")
+                    state["last_modified"] = response.headers.get("last-modified")
+                    self._merge()
+            # A 304 revalidates a restored copy just as a new body replaces it
+            state["restored"] = False
+            state["fetched_at"] = time.time()
+            state["error"] = None
+            await NEWS_CACHE.set(feed["id"], {
+                k: state[k] for k in ("articles", "etag", "last_modified", "fetched_at")
+            })
+        except Exception as e:
+            state["error"] = (str(e) or type(e).__name__).splitlines()[0]
+            logging.error(f"Failed to fetch RSS from {feed['name']}: {e}")
+        state["checked_at"] = time.time()
+
+    def _ingest(self, articles: List[dict]) -> List[dict]:
+        now = time.time()
+        for article in articles:
+            first_seen = self._first_seen.setdefault(article["id"], now)
+            if article["published_ts"] is None:
+                article["published_ts"] = first_seen
+            article["published_at"] = datetime.fromtimestamp(article["published_ts"], timezone.utc).isoformat()
+        articles.sort(key=_article_sort_key)
+        return articles
+
+    def _merge(self) -> None:
+        merged: List[dict] = []
+        seen: set = set()
+        per_feed = [self._state[feed["id"]]["articles"] or [] for feed in self.feeds]
+        for article in heapq.merge(*per_feed, key=_article_sort_key):
+            if article["id"] in seen:
+                continue
+            seen.add(article["id"])
+            merged.append(article)
+        self._first_seen = {k: v for k, v in self._first_seen.items() if k in seen}
+        self.merged = merged
+        self._merged_keys = [_article_sort_key(a) for a in merged]
+        self.updated_at = datetime.now(timezone.utc).isoformat()
+
+    def page(self, cursor: Optional[str], limit: int) -> Tuple[List[dict], Optional[str]]:
+        """Articles after `cursor` (newest first) and the cursor for the next page"""
+        merged, keys = self.merged, self._merged_keys
+        start = bisect.bisect_right(keys, _decode_news_cursor(cursor)) if cursor else 0
+        items = merged[start:start + limit]
+        more = start + limit < len(merged)
+        return items, (_encode_news_cursor(keys[start + limit - 1]) if more else None)
+
+    async def _run(self):
+        while True:
+            due = [self.refresh(feed) for feed in self.feeds if self._due(feed)]
+            if due:
+                await asyncio.wait(due)
+            await asyncio.sleep(NEWS_REFRESH_TICK_SECONDS)
+
+    async def _restore(self) -> None:
+        for feed in self.feeds:
+            state = self._state[feed["id"]]
+            cached = await NEWS_CACHE.get(feed["id"])
+            if cached and state["articles"] is None and cached.get("articles") is not None:
+                state.update(cached, restored=True)
+        if any(self._state[feed["id"]]["restored"] for feed in self.feeds):
+            self._merge()
+
+    async def ensure_loaded(self) -> None:
+        """
+        Start the refresh loop. Only requests before a feed's first fetch finishes wait, and
+        at most until the response deadline.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        cold = {
+            feed["id"]: self.refresh(feed) for feed in self.feeds
+            if not self._state[feed["id"]]["checked_at"] and self._state[feed["id"]]["articles"] is None
+        }
+        if not cold:
+            return
+        deadline = time.time() + NEWS_RESPONSE_DEADLINE_SECONDS
+        if self._restore_task is None:
+            self._restore_task = asyncio.create_task(self._restore())
+        while True:
+            # A feed stops holding up the response once it has articles, fetched or restored
+            missing = [
+                task for feed_id, task in cold.items()
+                if not task.done() and self._state[feed_id]["articles"] is None
+            ]
+            remaining = deadline - time.time()
+            if not missing or remaining <= 0:
+                return
+            waiters = missing if self._restore_task.done() else [*missing, self._restore_task]
+            await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+    def source_status(self) -> List[Dict[str, Any]]:
+        """Per-feed freshness: fresh, stale (past TTL), cached (last good copy), pending or error"""
+        now = time.time()
+        statuses = []
+        for feed in self.feeds:
+            state = self._state[feed["id"]]
+            fetched_at = state["fetched_at"]
+            if state["articles"] is None:
+                status = "error" if state["error"] else "pending"
+            elif state["restored"]:
+                status = "cached"
+            elif state["error"] or now - fetched_at >= self._ttl(feed):
+                status = "stale"
+            else:
+                status = "fresh"
+            statuses.append({
+                "id": feed["id"],
+                "status": status,
+                "articles": len(state["articles"] or []),
+                "fetched_at": datetime.fromtimestamp(fetched_at, timezone.utc).isoformat() if fetched_at else None,
+                "age_seconds": round(now - fetched_at, 1) if fetched_at else None,
+                "refreshing": feed["id"] in self._inflight and not self._inflight[feed["id"]].done(),
+                "error": state["error"],
+            })
+        return statuses
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in self._inflight.values():
+            task.cancel()
+
+
+NEWS_AGGREGATOR = NewsAggregator(RSS_FEEDS)
 
 @api_router.get("/news")
-async def get_news():
-    """Get news from all RSS sources"""
-    all_articles = []
-    
-    # Fetch all feeds concurrently
-    tasks = [fetch_rss_feed(feed) for feed in RSS_FEEDS]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    
-    for result in results:
-        if isinstance(result, list):
-            all_articles.extend(result)
-    
-    # Sort by time (most recent first) - simple string sort works for RSS dates
-    all_articles.sort(key=lambda x: x.get('time', ''), reverse=True)
-    
+async def get_news(cursor: Optional[str] = None, limit: int = NEWS_PAGE_DEFAULT_LIMIT):
+    """
+    Get news from all RSS sources, newest first (served from memory, refreshed in the background).
+    Pass the returned `next_cursor` as `cursor` for the following page.
+    """
+    await NEWS_AGGREGATOR.ensure_loaded()
+    articles, next_cursor = NEWS_AGGREGATOR.page(cursor, max(1, min(limit, NEWS_PAGE_MAX_LIMIT)))
     return {
-        "articles": all_articles,
+        "articles": articles,
+        "next_cursor": next_cursor,
         "sources": RSS_FEEDS,
-        "last_updated": datetime.now(timezone.utc).isoformat()
+        "source_status": NEWS_AGGREGATOR.source_status(),
+        "last_updated": NEWS_AGGREGATOR.updated_at or datetime.now(timezone.utc).isoformat()
     }
 
 # ============== CONSTITUENCY ENDPOINTS ==============
 
 # Import constituency data from separate file
 from constituencies_data import ALL_CONSTITUENCIES, CONSTITUENCY_CANDIDATES, FEDERAL_CONSTITUENCIES
+from constituency_index import ConstituencyIndex, normalize_name as _normalize_name
+
+# Indexes over the local lists; kept in sync by the add_* endpoints below
+LOCAL_INDEX = ConstituencyIndex(ALL_CONSTITUENCIES, CONSTITUENCY_CANDIDATES)
+# Index over the last remote payload, rebuilt whenever that payload is re-fetched
+REMOTE_INDEX: Dict[str, Any] = {"loaded_at": None, "index": None}
 
 # Remote constituency source (legacy backend)
 REMOTE_BACKEND_URL = os.environ.get(
@@ -869,19 +2528,70 @@ REMOTE_BACKEND_URL = os.environ.get(
     "https://nepali-ballot2-production.up.railway.app"
 ).rstrip("/")
 
-CONSTITUENCY_CACHE: Dict[str, Any] = {"timestamp": 0, "data": None}
+# Both remote lists are fetched concurrently and must arrive within this budget
+REMOTE_FETCH_DEADLINE_SECONDS = float(os.environ.get("REMOTE_FETCH_DEADLINE_SECONDS", "8"))
+
 CONSTITUENCY_CACHE_TTL_SECONDS = 60 * 10
+CONSTITUENCY_CACHE_DEGRADED_TTL_SECONDS = 60  # partial/local results retry the remote sooner
+CONSTITUENCY_CACHE_STALE_SECONDS = 24 * 60 * 60
+
+
+def _constituency_ttl(data: Dict[str, Any]) -> float:
+    if data.get("source") == "remote-backend":
+        return CONSTITUENCY_CACHE_TTL_SECONDS
+    return CONSTITUENCY_CACHE_DEGRADED_TTL_SECONDS
+
+
+CONSTITUENCY_CACHE = _cache_namespace(
+    "constituencies", CONSTITUENCY_CACHE_TTL_SECONDS, CONSTITUENCY_CACHE_STALE_SECONDS, ttl_for=_constituency_ttl
+)
 
-WIKI_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 WIKI_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+WIKI_NOT_FOUND_TTL_SECONDS = 24 * 60 * 60
+WIKI_ERROR_TTL_SECONDS = 5 * 60  # transient failures retry soon instead of sticking for a week
+WIKI_HOST = "en.wikipedia.org"
+
+
+def _wiki_ttl(data: Dict[str, Any]) -> float:
+    if data.get("lookup_status") == "error":
+        return WIKI_ERROR_TTL_SECONDS
+    if not data.get("title"):
+        return WIKI_NOT_FOUND_TTL_SECONDS
+    return WIKI_CACHE_TTL_SECONDS
+
+
+def _wiki_placeholder(query: str, status: str) -> Dict[str, Any]:
+    """Summary payload for a query with no usable page (status: not_found or error)."""
+    return {
+        "query": query,
+        "title": None,
+        "page_url": None,
+        "image_url": WIKI_FALLBACK_IMAGE_URL,
+        "summary": None,
+        "description": None,
+        "lookup_status": status,
+    }
+
+# Summaries also persist to Mongo (wiki_summaries) so restarts and redeploys start warm
+WIKI_PERSIST = os.environ.get("WIKI_PERSIST", "1").lower() not in ("0", "false", "no")
+WIKI_STORE = MongoCacheBackend("wiki_summaries")
+if not WIKI_PERSIST:
+    _wiki_backend = None
+elif isinstance(CACHE_STORE, MemoryCacheBackend):
+    _wiki_backend = TieredCacheBackend(CACHE_STORE, WIKI_STORE)
+else:
+    _wiki_backend = WIKI_STORE  # already a shared Mongo cache, no local tier to promote into
+WIKI_CACHE = _cache_namespace("wiki", WIKI_CACHE_TTL_SECONDS, backend=_wiki_backend, ttl_for=_wiki_ttl)
 WIKI_SEMAPHORE = asyncio.Semaphore(5)
+WIKI_API_URL = f"https://{WIKI_HOST}/w/api.php"
+WIKI_BATCH_SIZE = 50  # max titles per action=query request for non-bot clients
+# Constituency pages wait this long for Wikipedia, then return what's ready;
+# unfinished lookups keep running and land in WIKI_CACHE for the next request
+WIKI_ENRICH_TIMEOUT_SECONDS = float(os.environ.get("WIKI_ENRICH_TIMEOUT_SECONDS", "3"))
 WIKI_FALLBACK_IMAGE_URL = (
     "https://upload.wikimedia.org/wikipedia/commons/7/7c/Profile_avatar_placeholder_large.png"
 )
 
-def _normalize_name(value: str) -> str:
-    return re.sub(r"\s+", " ", value or "").strip().lower()
-
 def _truncate_text(value: Optional[str], max_len: int = 280) -> Optional[str]:
     if not value:
         return None
@@ -900,106 +2610,237 @@ def _merge_election_history(candidate: Dict[str, Any], fallback: Dict[str, Any])
 
 async def _fetch_remote_json(path: str) -> Any:
     url = f"{REMOTE_BACKEND_URL}{path}"
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.json()
+    client = _http_client("remote")
+    resp = await client.get(url)
+    resp.raise_for_status()
+    return resp.json()
+
+def _constituency_index_for(data: Dict[str, Any]) -> ConstituencyIndex:
+    """Index for a payload from _get_remote_constituency_data (local fallback uses LOCAL_INDEX)."""
+    if data.get("source") == "local-fallback":
+        return LOCAL_INDEX
+    if REMOTE_INDEX["index"] is None or REMOTE_INDEX["loaded_at"] != data.get("loaded_at"):
+        REMOTE_INDEX["index"] = ConstituencyIndex(data.get("constituencies") or [], data.get("candidates") or [])
+        REMOTE_INDEX["loaded_at"] = data.get("loaded_at")
+    return REMOTE_INDEX["index"]
 
 async def _get_remote_constituency_data(refresh: bool = False) -> Dict[str, Any]:
-    now = time.time()
-    if (
-        CONSTITUENCY_CACHE["data"]
-        and not refresh
-        and now - CONSTITUENCY_CACHE["timestamp"] < CONSTITUENCY_CACHE_TTL_SECONDS
-    ):
-        return CONSTITUENCY_CACHE["data"]
-    try:
-        constituencies = await _fetch_remote_json("/api/constituencies")
-        candidates = await _fetch_remote_json("/api/constituency-candidates")
-        data = {"constituencies": constituencies, "candidates": candidates, "source": "remote-backend"}
-        CONSTITUENCY_CACHE["data"] = data
-        CONSTITUENCY_CACHE["timestamp"] = now
-        return data
-    except Exception as exc:
-        logger.warning("Remote constituency fetch failed, using local data", exc_info=exc)
-        data = {
-            "constituencies": ALL_CONSTITUENCIES,
-            "candidates": CONSTITUENCY_CANDIDATES,
-            "source": "local-fallback",
-        }
-        CONSTITUENCY_CACHE["data"] = data
-        CONSTITUENCY_CACHE["timestamp"] = now
+    return await CONSTITUENCY_CACHE.get_or_load("all", _load_constituency_data, refresh=refresh)
+
+async def _load_constituency_data() -> Dict[str, Any]:
+    """
+    Fetch both remote lists concurrently under REMOTE_FETCH_DEADLINE_SECONDS. A list that
+    fails or misses the deadline is replaced by its local counterpart ("remote-partial");
+    only when both fail is the whole payload local.
+    """
+    parts = {
+        "constituencies": (
+            asyncio.ensure_future(_fetch_remote_json("/api/constituencies")),
+            ALL_CONSTITUENCIES,
+        ),
+        "candidates": (
+            asyncio.ensure_future(_fetch_remote_json("/api/constituency-candidates")),
+            CONSTITUENCY_CANDIDATES,
+        ),
+    }
+    await asyncio.wait([task for task, _ in parts.values()], timeout=REMOTE_FETCH_DEADLINE_SECONDS)
+
+    data: Dict[str, Any] = {}
+    local_parts: List[str] = []
+    for name, (task, local) in parts.items():
+        if not task.done():
+            task.cancel()
+            logger.warning("Remote %s fetch missed the %.0fs deadline, using local data", name, REMOTE_FETCH_DEADLINE_SECONDS)
+        elif task.exception() is not None:
+            logger.warning("Remote %s fetch failed, using local data", name, exc_info=task.exception())
+        else:
+            data[name] = task.result()
+            continue
+        data[name] = local
+        local_parts.append(name)
+
+    if len(local_parts) == len(parts):
+        data["source"] = "local-fallback"
         return data
+    data["source"] = "remote-partial" if local_parts else "remote-backend"
+    data["local_parts"] = local_parts
+    data["loaded_at"] = time.time()
+    _constituency_index_for(data)
+    return data
 
 async def _get_wiki_summary(query: str) -> Dict[str, Any]:
-    now = time.time()
-    cache_key = _normalize_name(query)
-    cached = WIKI_CACHE.get(cache_key)
-    if cached and now - cached[0] < WIKI_CACHE_TTL_SECONDS:
-        return cached[1]
+    return await WIKI_CACHE.get_or_load(_normalize_name(query), lambda: _fetch_wiki_summary(query))
 
+async def _fetch_wiki_summary(query: str) -> Dict[str, Any]:
+    if not HTTP_BREAKER.allow(WIKI_HOST):
+        return _wiki_placeholder(query, "error")
     async with WIKI_SEMAPHORE:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        client = _http_client("wiki")
+        try:
+            search_url = WIKI_API_URL
+            search_params = {
+                "action": "opensearch",
+                "search": query,
+                "limit": 1,
+                "namespace": 0,
+                "format": "json",
+            }
+            search_resp = await client.get(search_url, params=search_params)
+            search_resp.raise_for_status()
+            search_data = search_resp.json()
+            title = search_data[1][0] if len(search_data) > 1 and search_data[1] else None
+
+            if not title:
+                HTTP_BREAKER.record_success(WIKI_HOST)
+                return _wiki_placeholder(query, "not_found")
+
+            summary_url = f"https://{WIKI_HOST}/api/rest_v1/page/summary/{title}"
+            summary_resp = await client.get(summary_url)
+            if summary_resp.status_code == 404:
+                HTTP_BREAKER.record_success(WIKI_HOST)
+                return _wiki_placeholder(query, "not_found")
+            summary_resp.raise_for_status()
+            summary = summary_resp.json()
+            HTTP_BREAKER.record_success(WIKI_HOST)
+            image_url = None
+            if isinstance(summary.get("originalimage"), dict):
+                image_url = summary["originalimage"].get("source")
+            if not image_url and isinstance(summary.get("thumbnail"), dict):
+                image_url = summary["thumbnail"].get("source")
+            if not image_url:
+                image_url = WIKI_FALLBACK_IMAGE_URL
+
+            data = {
+                "query": query,
+                "title": summary.get("title"),
+                "page_url": summary.get("content_urls", {}).get("desktop", {}).get("page"),
+                "image_url": image_url,
+                "summary": _truncate_text(summary.get("extract")),
+                "description": _truncate_text(summary.get("description"), max_len=140),
+                "lookup_status": "hit",
+            }
+            return data
+        except Exception as exc:
+            HTTP_BREAKER.record_failure(WIKI_HOST)
+            logger.warning("Wikipedia lookup failed for %s", query, exc_info=exc)
+            return _wiki_placeholder(query, "error")
+
+async def _resolve_wiki_titles(queries: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve up to WIKI_BATCH_SIZE queries as exact titles (following normalization and
+    redirects) in one action=query request, plus continuations. Returns summary data
+    keyed by query for those that matched a page.
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "redirects": 1,
+        "titles": "|".join(queries),
+        "prop": "pageimages|extracts|description|info",
+        "piprop": "original|thumbnail",
+        "pithumbsize": 400,
+        "pilimit": WIKI_BATCH_SIZE,
+        "exintro": 1,
+        "explaintext": 1,
+        "exlimit": "max",
+        "inprop": "url",
+    }
+    pages: Dict[str, Dict[str, Any]] = {}
+    aliases: Dict[str, str] = {}  # normalized/redirected title -> target title
+    continuation: Dict[str, Any] = {}
+    HTTP_BREAKER.check(WIKI_HOST)
+    async with WIKI_SEMAPHORE:
+        client = _http_client("wiki")
+        while True:
             try:
-                search_url = "https://en.wikipedia.org/w/api.php"
-                search_params = {
-                    "action": "opensearch",
-                    "search": query,
-                    "limit": 1,
-                    "namespace": 0,
-                    "format": "json",
-                }
-                search_resp = await client.get(search_url, params=search_params)
-                search_resp.raise_for_status()
-                search_data = search_resp.json()
-                title = search_data[1][0] if len(search_data) > 1 and search_data[1] else None
-
-                if not title:
-                    data = {
-                        "query": query,
-                        "title": None,
-                        "page_url": None,
-                        "image_url": WIKI_FALLBACK_IMAGE_URL,
-                        "summary": None,
-                        "description": None,
-                    }
-                    WIKI_CACHE[cache_key] = (now, data)
-                    return data
-
-                summary_url = f"https://en.wikipedia.org/api/rest_v1/page/summary/{title}"
-                summary_resp = await client.get(summary_url)
-                summary_resp.raise_for_status()
-                summary = summary_resp.json()
-                image_url = None
-                if isinstance(summary.get("originalimage"), dict):
-                    image_url = summary["originalimage"].get("source")
-                if not image_url and isinstance(summary.get("thumbnail"), dict):
-                    image_url = summary["thumbnail"].get("source")
-                if not image_url:
-                    image_url = WIKI_FALLBACK_IMAGE_URL
-
-                data = {
-                    "query": query,
-                    "title": summary.get("title"),
-                    "page_url": summary.get("content_urls", {}).get("desktop", {}).get("page"),
-                    "image_url": image_url,
-                    "summary": _truncate_text(summary.get("extract")),
-                    "description": _truncate_text(summary.get("description"), max_len=140),
-                }
-                WIKI_CACHE[cache_key] = (now, data)
-                return data
-            except Exception as exc:
-                logger.warning("Wikipedia lookup failed for %s", query, exc_info=exc)
-                data = {
-                    "query": query,
-                    "title": None,
-                    "page_url": None,
-                    "image_url": WIKI_FALLBACK_IMAGE_URL,
-                    "summary": None,
-                    "description": None,
-                }
-                WIKI_CACHE[cache_key] = (now, data)
-                return data
+                resp = await client.get(WIKI_API_URL, params={**params, **continuation})
+                resp.raise_for_status()
+                body = resp.json()
+            except Exception:
+                HTTP_BREAKER.record_failure(WIKI_HOST)
+                raise
+            HTTP_BREAKER.record_success(WIKI_HOST)
+            result = body.get("query") or {}
+            for alias in (result.get("normalized") or []) + (result.get("redirects") or []):
+                aliases[alias["from"]] = alias["to"]
+            for page in result.get("pages") or []:
+                if page.get("missing") or page.get("invalid"):
+                    continue
+                # Continuations return the remaining props for pages already seen
+                pages.setdefault(page["title"], {}).update(page)
+            if "continue" not in body:
+                break
+            continuation = body["continue"]
+
+    resolved: Dict[str, Dict[str, Any]] = {}
+    for query in queries:
+        title = query
+        for _ in range(3):  # query -> normalized title -> redirect target
+            if title in pages or title not in aliases:
+                break
+            title = aliases[title]
+        page = pages.get(title)
+        if not page:
+            continue
+        image_url = (
+            (page.get("original") or {}).get("source")
+            or (page.get("thumbnail") or {}).get("source")
+            or WIKI_FALLBACK_IMAGE_URL
+        )
+        resolved[query] = {
+            "query": query,
+            "title": page.get("title"),
+            "page_url": page.get("fullurl"),
+            "image_url": image_url,
+            "summary": _truncate_text(page.get("extract")),
+            "description": _truncate_text(page.get("description"), max_len=140),
+            "lookup_status": "hit",
+        }
+    return resolved
+
+async def _get_wiki_summaries(queries: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve many queries at once: cache hits first, then batched exact-title lookups
+    (WIKI_BATCH_SIZE per request), then the per-query search for whatever didn't match.
+    Keys already being looked up elsewhere are joined rather than fetched again.
+    """
+    items = {_normalize_name(query): query for query in queries}
+    by_key = await WIKI_CACHE.get_or_load_many(items, _load_wiki_batch)
+    return {q: by_key[_normalize_name(q)] for q in queries if _normalize_name(q) in by_key}
+
+async def _load_wiki_batch(uncached: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """Summaries for {cache key: query}, batched where possible; caching is up to the caller."""
+    by_key: Dict[str, Dict[str, Any]] = {}
+    batchable = [q for q in uncached.values() if "|" not in q]
+    chunks = [batchable[i:i + WIKI_BATCH_SIZE] for i in range(0, len(batchable), WIKI_BATCH_SIZE)]
+    batches = await asyncio.gather(*[_resolve_wiki_titles(chunk) for chunk in chunks], return_exceptions=True)
+    for batch in batches:
+        if isinstance(batch, UpstreamUnavailable):
+            continue
+        if isinstance(batch, Exception):
+            logger.warning("Wikipedia batch lookup failed, searching individually", exc_info=batch)
+            continue
+        for query, data in batch.items():
+            by_key[_normalize_name(query)] = data
+
+    # These keys are claimed by the caller's single-flight, so search directly rather than
+    # through _get_wiki_summary (which would wait on that same flight)
+    leftovers = {key: q for key, q in uncached.items() if key not in by_key}
+    searched = await asyncio.gather(*[_fetch_wiki_summary(q) for q in leftovers.values()])
+    by_key.update(zip(leftovers, searched))
+    return by_key
+
+async def _get_wiki_summaries_until(names: List[str], timeout: float) -> Dict[str, Dict[str, Any]]:
+    """Look up names concurrently (bounded by WIKI_SEMAPHORE); returns those resolved within `timeout` seconds."""
+    tasks = {name: asyncio.ensure_future(_get_wiki_summary(name)) for name in dict.fromkeys(names)}
+    if not tasks:
+        return {}
+    _, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        # Left running to warm the cache; consume the outcome so failures aren't reported as unhandled
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return {name: task.result() for name, task in tasks.items() if task not in pending and not task.exception()}
 
 def _build_candidate_merits(candidate: Dict[str, Any], wiki_summary: Optional[str]) -> List[str]:
     merits: List[str] = []
@@ -1041,54 +2882,45 @@ async def get_constituency_stats():
 @api_router.get("/constituencies/{constituency_id}")
 async def get_constituency(constituency_id: str):
     """Get specific constituency details"""
-    for c in ALL_CONSTITUENCIES:
-        if c["id"] == constituency_id:
-            candidates = [cand for cand in CONSTITUENCY_CANDIDATES if cand.get("constituency_id") == constituency_id]
-            return {**c, "candidates": candidates}
+    c = LOCAL_INDEX.constituency(constituency_id)
+    if c:
+        return {**c, "candidates": LOCAL_INDEX.candidates_in(constituency_id)}
     raise HTTPException(status_code=404, detail="Constituency not found")
 
 @api_router.get("/constituencies/{constituency_id}/candidates")
 async def get_constituency_candidates_enriched(constituency_id: str, refresh: bool = False):
     """Get constituency candidates with Wikipedia images and election history."""
     remote_data = await _get_remote_constituency_data(refresh=refresh)
-    remote_constituencies = remote_data.get("constituencies") or []
-    remote_candidates = remote_data.get("candidates") or []
+    remote_index = _constituency_index_for(remote_data)
 
-    constituency = next(
-        (c for c in remote_constituencies if c.get("id") == constituency_id), None
-    )
+    constituency = remote_index.constituency(constituency_id)
     if not constituency:
-        constituency = next((c for c in ALL_CONSTITUENCIES if c.get("id") == constituency_id), None)
+        constituency = LOCAL_INDEX.constituency(constituency_id)
 
     if not constituency:
         raise HTTPException(status_code=404, detail="Constituency not found")
 
     name_match = _normalize_name(constituency.get("name", ""))
-    candidates = [
-        c for c in remote_candidates
-        if c.get("constituency_id") == constituency_id
-        or _normalize_name(c.get("constituency", "")) == name_match
-    ]
+    candidates = remote_index.candidates_for(constituency_id, name_match)
 
     if not candidates:
-        candidates = [
-            c for c in CONSTITUENCY_CANDIDATES
-            if c.get("constituency_id") == constituency_id
-            or _normalize_name(c.get("constituency", "")) == name_match
-        ]
+        candidates = LOCAL_INDEX.candidates_for(constituency_id, name_match)
 
-    fallback_map = {
-        _normalize_name(c.get("name", "")): c for c in CONSTITUENCY_CANDIDATES
-    }
+    wiki_by_name = await _get_wiki_summaries_until(
+        [c["name"] for c in candidates if c.get("name")], WIKI_ENRICH_TIMEOUT_SECONDS
+    )
 
     enriched = []
+    wiki_pending = 0
     for candidate in candidates:
         normalized = _normalize_name(candidate.get("name", ""))
-        fallback = fallback_map.get(normalized, {})
+        fallback = LOCAL_INDEX.candidate_named(normalized) or {}
         merged = {**fallback, **candidate}
         merged = _merge_election_history(merged, fallback)
 
-        wiki = await _get_wiki_summary(candidate.get("name", "")) if candidate.get("name") else {}
+        wiki = wiki_by_name.get(candidate.get("name")) or {}
+        if candidate.get("name") and candidate["name"] not in wiki_by_name:
+            wiki_pending += 1
         if wiki.get("image_url") and not merged.get("image_url"):
             merged["image_url"] = wiki["image_url"]
         merged["wiki"] = wiki
@@ -1100,6 +2932,7 @@ async def get_constituency_candidates_enriched(constituency_id: str, refresh: bo
         "candidates": enriched,
         "total_candidates": len(enriched),
         "source": remote_data.get("source", "remote-backend"),
+        "wiki_pending": wiki_pending,  # >0 means a refetch shortly will have more Wikipedia data
     }
 
 @api_router.post("/wiki/batch")
@@ -1109,12 +2942,12 @@ async def wiki_batch_lookup(payload: WikiBatchRequest):
     if not queries:
         return {"results": []}
 
-    tasks = [_get_wiki_summary(q) for q in queries]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    resolved = await _get_wiki_summaries(queries)
 
     output = []
-    for query, result in zip(queries, results):
-        if isinstance(result, Exception):
+    for query in queries:
+        result = resolved.get(query)
+        if result is None:
             output.append({
                 "query": query,
                 "title": None,
@@ -1156,6 +2989,7 @@ async def add_constituency(data: dict):
         "candidates_count": 0
     }
     ALL_CONSTITUENCIES.append(new_constituency)
+    LOCAL_INDEX.add_constituency(new_constituency)
     return new_constituency
 
 @api_router.post("/constituency-candidates")
@@ -1179,6 +3013,7 @@ async def add_constituency_candidate(data: dict):
         "election_history": data.get("election_history", [])
     }
     CONSTITUENCY_CANDIDATES.append(new_candidate)
+    LOCAL_INDEX.add_candidate(new_candidate)
     return new_candidate
 
 # ============== FOOTBALL API ENDPOINTS ==============
@@ -1206,65 +3041,207 @@ LEAGUE_CODES = {
     "CL": "Champions League"
 }
 
+# Free-tier quota: each league gets an equal share per day. Base TTLs are picked so a league's
+# matches (every 2h) plus standings (every 6h) fit its share of the default 100-request budget.
+FOOTBALL_DAILY_BUDGET = int(os.environ.get("FOOTBALL_DAILY_BUDGET", "100"))
+FOOTBALL_TTL_SECONDS = {"matches": 2 * 60 * 60, "standings": 6 * 60 * 60}
+FOOTBALL_LIVE_TTL_SECONDS = 10 * 60  # while a league has matches in play (or about to kick off)
+FOOTBALL_STALE_SECONDS = 2 * 24 * 60 * 60  # keep serving the last response when the budget is spent
+
+
+class FootballDataUnavailable(Exception):
+    """No API-Football response could be fetched or reused."""
+
+
+class FootballRequestBudget:
+    """
+    Daily API-Football request counter, reset at 00:00 UTC like the API's own quota.
+    Every league is entitled to an equal share. A league past its share may only spend what
+    the other leagues can no longer use today: their unspent shares, scaled by the fraction
+    of the day left. A busy league can't starve the rest, and quota unused by quiet
+    leagues becomes available as the day goes on.
+    """
+
+    def __init__(self, daily_limit: int, leagues: List[str]):
+        self.daily_limit = daily_limit
+        self.leagues = list(leagues)
+        self.share = daily_limit / max(1, len(self.leagues))
+        self._day = None
+        self.spent: Dict[str, int] = {}
+        self.remaining = daily_limit
+        self.denied = 0
+
+    def _roll(self) -> None:
+        today = datetime.now(timezone.utc).date()
+        if today != self._day:
+            self._day = today
+            self.spent = {league: 0 for league in self.leagues}
+            self.remaining = self.daily_limit
+
+    def _reserved_for_others(self, league: str) -> float:
+        now = datetime.now(timezone.utc)
+        day_left = 1 - (now.hour * 3600 + now.minute * 60 + now.second) / 86400
+        unspent = sum(max(0.0, self.share - n) for other, n in self.spent.items() if other != league)
+        return unspent * day_left
+
+    def try_spend(self, league: str) -> bool:
+        self._roll()
+        allowed = self.remaining > 0 and (
+            self.spent.get(league, 0) < self.share
+            or self.remaining - 1 >= self._reserved_for_others(league)
+        )
+        if not allowed:
+            self.denied += 1
+            return False
+        self.spent[league] = self.spent.get(league, 0) + 1
+        self.remaining -= 1
+        return True
+
+    def observe(self, headers) -> None:
+        """Trust the API's own count when it reports one (e.g. after a restart reset ours)."""
+        left = headers.get("x-ratelimit-requests-remaining")
+        if left is not None and left.isdigit():
+            self._roll()
+            self.remaining = min(self.remaining, int(left))
+
+    def stats(self) -> Dict[str, Any]:
+        self._roll()
+        return {
+            "daily_limit": self.daily_limit,
+            "remaining": self.remaining,
+            "share_per_league": round(self.share, 1),
+            "spent": dict(self.spent),
+            "denied": self.denied,
+        }
+
+
+FOOTBALL_BUDGET = FootballRequestBudget(FOOTBALL_DAILY_BUDGET, list(LEAGUE_IDS))
+
+
+def _football_ttl(kind: str, items: List[dict]) -> float:
+    """Base TTL for the kind; the live TTL while matches are in play or due to kick off sooner."""
+    ttl = FOOTBALL_TTL_SECONDS[kind]
+    if kind != "matches":
+        return ttl
+    now = time.time()
+    for match in items:
+        if match.get("status") == "LIVE":
+            return FOOTBALL_LIVE_TTL_SECONDS
+        if match.get("status") == "SCHEDULED" and match.get("date") and match.get("time"):
+            try:
+                kickoff = datetime.fromisoformat(f"{match['date']}T{match['time']}+00:00").timestamp()
+            except ValueError:
+                continue
+            if kickoff > now:
+                ttl = min(ttl, max(FOOTBALL_LIVE_TTL_SECONDS, kickoff - now))
+    return ttl
+
+
+FOOTBALL_CACHE = _cache_namespace(
+    "football", FOOTBALL_TTL_SECONDS["matches"], FOOTBALL_STALE_SECONDS, ttl_for=lambda data: data["ttl_seconds"]
+)
+
+
+async def _load_football(kind: str, league: str) -> Dict[str, Any]:
+    """
+    One API call if the budget allows. Otherwise (or if the call fails) the last response is
+    kept for another TTL, so the budget is re-checked at the same pace instead of per request.
+    A failed call with nothing to fall back on is cached as an empty, short-lived entry.
+    """
+    key = f"{kind}:{league}"
+    items = None
+    spent = FOOTBALL_BUDGET.try_spend(league)
+    if spent:
+        fetch = fetch_live_football_data if kind == "matches" else fetch_standings_data
+        items = await fetch(LEAGUE_IDS[league])
+    if items is None:
+        previous = await FOOTBALL_CACHE.peek(key)
+        if previous is not None:
+            return {**previous, "ttl_seconds": _football_ttl(kind, previous["items"])}
+        if not spent:
+            raise FootballDataUnavailable(key)
+        return {
+            "items": [],
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "ttl_seconds": FOOTBALL_LIVE_TTL_SECONDS,
+        }
+    return {
+        "items": items,
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "ttl_seconds": _football_ttl(kind, items),
+    }
+
+
+async def _football_data(kind: str, league: str) -> Optional[Dict[str, Any]]:
+    """Cached API-Football data shared by all users, or None when there is none to serve."""
+    if not API_FOOTBALL_KEY or league not in LEAGUE_IDS:
+        return None
+    try:
+        return await FOOTBALL_CACHE.get_or_load(f"{kind}:{league}", lambda: _load_football(kind, league))
+    except FootballDataUnavailable:
+        return None
+
+
 async def fetch_live_football_data(league_id: int):
     """Fetch live/recent matches from API-Football"""
     if not API_FOOTBALL_KEY:
         return None
     
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            headers = {
-                "x-rapidapi-key": API_FOOTBALL_KEY,
-                "x-rapidapi-host": "v3.football.api-sports.io"
-            }
+        client = _http_client("football")
+        headers = {
+            "x-rapidapi-key": API_FOOTBALL_KEY,
+            "x-rapidapi-host": "v3.football.api-sports.io"
+        }
             
-            # Get today's and recent fixtures
-            from datetime import date, timedelta
-            today = date.today()
-            week_ago = today - timedelta(days=7)
-            week_ahead = today + timedelta(days=7)
+        # Get today's and recent fixtures
+        from datetime import date, timedelta
+        today = date.today()
+        week_ago = today - timedelta(days=7)
+        week_ahead = today + timedelta(days=7)
             
-            response = await client.get(
-                f"{API_FOOTBALL_BASE}/fixtures",
-                headers=headers,
-                params={
-                    "league": league_id,
-                    "season": 2024,
-                    "from": week_ago.isoformat(),
-                    "to": week_ahead.isoformat()
-                }
-            )
+        response = await client.get(
+            f"{API_FOOTBALL_BASE}/fixtures",
+            headers=headers,
+            params={
+                "league": league_id,
+                "season": 2024,
+                "from": week_ago.isoformat(),
+                "to": week_ahead.isoformat()
+            }
+        )
+        FOOTBALL_BUDGET.observe(response.headers)
             
-            if response.status_code == 200:
-                data = response.json()
-                matches = []
-                for fixture in data.get("response", [])[:15]:
-                    fx = fixture.get("fixture", {})
-                    teams = fixture.get("teams", {})
-                    goals = fixture.get("goals", {})
+        if response.status_code == 200:
+            data = response.json()
+            matches = []
+            for fixture in data.get("response", [])[:15]:
+                fx = fixture.get("fixture", {})
+                teams = fixture.get("teams", {})
+                goals = fixture.get("goals", {})
                     
-                    status = fx.get("status", {}).get("short", "NS")
-                    status_map = {
-                        "NS": "SCHEDULED", "TBD": "SCHEDULED",
-                        "1H": "LIVE", "2H": "LIVE", "HT": "LIVE", "ET": "LIVE", "P": "LIVE", "LIVE": "LIVE",
-                        "FT": "FINISHED", "AET": "FINISHED", "PEN": "FINISHED"
-                    }
+                status = fx.get("status", {}).get("short", "NS")
+                status_map = {
+                    "NS": "SCHEDULED", "TBD": "SCHEDULED",
+                    "1H": "LIVE", "2H": "LIVE", "HT": "LIVE", "ET": "LIVE", "P": "LIVE", "LIVE": "LIVE",
+                    "FT": "FINISHED", "AET": "FINISHED", "PEN": "FINISHED"
+                }
                     
-                    match_date = fx.get("date", "")[:10]
-                    match_time = fx.get("date", "")[11:16] if fx.get("date") else ""
+                match_date = fx.get("date", "")[:10]
+                match_time = fx.get("date", "")[11:16] if fx.get("date") else ""
                     
-                    matches.append({
-                        "homeTeam": teams.get("home", {}).get("name", "Unknown"),
-                        "awayTeam": teams.get("away", {}).get("name", "Unknown"),
-                        "homeScore": goals.get("home"),
-                        "awayScore": goals.get("away"),
-                        "status": status_map.get(status, "SCHEDULED"),
-                        "date": match_date,
-                        "time": match_time if status_map.get(status) == "SCHEDULED" else ("LIVE" if status_map.get(status) == "LIVE" else "FT"),
-                        "minute": fx.get("status", {}).get("elapsed")
-                    })
+                matches.append({
+                    "homeTeam": teams.get("home", {}).get("name", "Unknown"),
+                    "awayTeam": teams.get("away", {}).get("name", "Unknown"),
+                    "homeScore": goals.get("home"),
+                    "awayScore": goals.get("away"),
+                    "status": status_map.get(status, "SCHEDULED"),
+                    "date": match_date,
+                    "time": match_time if status_map.get(status) == "SCHEDULED" else ("LIVE" if status_map.get(status) == "LIVE" else "FT"),
+                    "minute": fx.get("status", {}).get("elapsed")
+                })
                 
-                return matches
+            return matches
     except Exception as e:
         logging.error(f"API-Football error: {e}")
     
@@ -1276,34 +3253,35 @@ async def fetch_standings_data(league_id: int):
         return None
     
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            headers = {
-                "x-rapidapi-key": API_FOOTBALL_KEY,
-                "x-rapidapi-host": "v3.football.api-sports.io"
-            }
+        client = _http_client("football")
+        headers = {
+            "x-rapidapi-key": API_FOOTBALL_KEY,
+            "x-rapidapi-host": "v3.football.api-sports.io"
+        }
             
-            response = await client.get(
-                f"{API_FOOTBALL_BASE}/standings",
-                headers=headers,
-                params={"league": league_id, "season": 2024}
-            )
+        response = await client.get(
+            f"{API_FOOTBALL_BASE}/standings",
+            headers=headers,
+            params={"league": league_id, "season": 2024}
+        )
+        FOOTBALL_BUDGET.observe(response.headers)
             
-            if response.status_code == 200:
-                data = response.json()
-                standings = []
-                league_data = data.get("response", [])
-                if league_data and league_data[0].get("league", {}).get("standings"):
-                    for team in league_data[0]["league"]["standings"][0][:10]:
-                        standings.append({
-                            "position": team.get("rank", 0),
-                            "team": team.get("team", {}).get("name", "Unknown"),
-                            "played": team.get("all", {}).get("played", 0),
-                            "won": team.get("all", {}).get("win", 0),
-                            "draw": team.get("all", {}).get("draw", 0),
-                            "lost": team.get("all", {}).get("lose", 0),
-                            "points": team.get("points", 0)
-                        })
-                return standings
+        if response.status_code == 200:
+            data = response.json()
+            standings = []
+            league_data = data.get("response", [])
+            if league_data and league_data[0].get("league", {}).get("standings"):
+                for team in league_data[0]["league"]["standings"][0][:10]:
+                    standings.append({
+                        "position": team.get("rank", 0),
+                        "team": team.get("team", {}).get("name", "Unknown"),
+                        "played": team.get("all", {}).get("played", 0),
+                        "won": team.get("all", {}).get("win", 0),
+                        "draw": team.get("all", {}).get("draw", 0),
+                        "lost": team.get("all", {}).get("lose", 0),
+                        "points": team.get("points", 0)
+                    })
+            return standings
     except Exception as e:
         logging.error(f"API-Football standings error: {e}")
     
@@ -1404,32 +3382,29 @@ SAMPLE_STANDINGS = {
 
 @api_router.get("/football/matches")
 async def get_football_matches(league: str = "PL"):
-    """Get football matches for a league - tries live API first, falls back to sample data"""
-    league_id = LEAGUE_IDS.get(league)
-    
-    # Try to fetch from live API
-    if league_id:
-        live_matches = await fetch_live_football_data(league_id)
-        if live_matches:
-            return {"matches": live_matches, "league": LEAGUE_CODES.get(league, league), "source": "live"}
+    """Get football matches for a league - cached live API data first, falls back to sample data"""
+    data = await _football_data("matches", league)
+    if data and data["items"]:
+        return {"matches": data["items"], "league": LEAGUE_CODES.get(league, league), "source": "live", "fetched_at": data["fetched_at"]}
     
     # Fallback to sample data
     return {"matches": SAMPLE_MATCHES.get(league, []), "league": LEAGUE_CODES.get(league, league), "source": "sample"}
 
 @api_router.get("/football/standings")
 async def get_football_standings(league: str = "PL"):
-    """Get league standings - tries live API first, falls back to sample data"""
-    league_id = LEAGUE_IDS.get(league)
-    
-    # Try to fetch from live API
-    if league_id:
-        live_standings = await fetch_standings_data(league_id)
-        if live_standings:
-            return {"standings": live_standings, "league": LEAGUE_CODES.get(league, league), "source": "live"}
+    """Get league standings - cached live API data first, falls back to sample data"""
+    data = await _football_data("standings", league)
+    if data and data["items"]:
+        return {"standings": data["items"], "league": LEAGUE_CODES.get(league, league), "source": "live", "fetched_at": data["fetched_at"]}
     
     # Fallback to sample data
     return {"standings": SAMPLE_STANDINGS.get(league, []), "league": LEAGUE_CODES.get(league, league), "source": "sample"}
 
+@api_router.get("/football/budget")
+async def get_football_budget():
+    """API-Football requests spent today, per league"""
+    return FOOTBALL_BUDGET.stats()
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -1448,6 +3423,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_vote_services():
+    await _ensure_indexes()
+    await VOTE_TALLY.start()
+    seeded = await _seed_voter_tokens()
+    if VOTE_WRITE_BEHIND and seeded:
+        await VOTE_QUEUE.start()
+
+@app.on_event("startup")
+async def startup_http_clients():
+    for profile in HTTP_PROFILES:
+        _http_client(profile)
+
+@app.on_event("startup")
+async def startup_ec_prefetch():
+    if EC_PREFETCH_ENABLED:
+        BACKGROUND_TASKS.append(asyncio.create_task(_ec_prefetch_loop()))
+    if EC_POLL_ENABLED:
+        BACKGROUND_TASKS.append(asyncio.create_task(_ec_poll_loop()))
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    for task in BACKGROUND_TASKS:
+        task.cancel()
+    BACKGROUND_TASKS.clear()
+    await RESULTS_BROADCASTER.stop()
+    await NEWS_AGGREGATOR.stop()
+    await VOTE_QUEUE.stop()
+    await VOTE_TALLY.stop()
+    await _close_http_clients()
+    EC_PARSE_POOL.shutdown(wait=False)
     client.close()
@@ -0,0 +1,81 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+
+
+def _namespace() -> server.CacheNamespace:
+    return server.CacheNamespace(server.MemoryCacheBackend(100, 10 ** 6), "test", ttl=60)
+
+
+def test_get_or_load_many_joins_single_key_loads():
+    async def scenario():
+        cache = _namespace()
+        calls = []
+
+        async def batch_loader(items):
+            calls.append(sorted(items))
+            await asyncio.sleep(0.01)
+            return {key: f"v-{item}" for key, item in items.items()}
+
+        async def single_loader():
+            calls.append("single")
+            return "single"
+
+        many = asyncio.ensure_future(cache.get_or_load_many({"a": 1, "b": 2}, batch_loader))
+        await asyncio.sleep(0)
+        single = await cache.get_or_load("a", single_loader)
+        assert await many == {"a": "v-1", "b": "v-2"}
+        assert single == "v-1"
+        assert calls == [["a", "b"]]
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_get_or_load_many_does_not_strand_keys():
+    async def scenario():
+        cache = _namespace()
+        release = asyncio.Event()
+
+        async def batch_loader(items):
+            await release.wait()
+            return {key: item for key, item in items.items()}
+
+        caller = asyncio.ensure_future(cache.get_or_load_many({"a": 1}, batch_loader))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        async def single_loader():
+            return "fresh"
+
+        value = await asyncio.wait_for(cache.get_or_load("a", single_loader), timeout=1)
+        assert value in (1, "fresh")
+        assert len(cache._flights) == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_get_or_load_many_with_failing_loader_frees_keys():
+    async def scenario():
+        cache = _namespace()
+
+        async def batch_loader(items):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        caller = asyncio.ensure_future(cache.get_or_load_many({"a": 1}, batch_loader))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0.05)
+
+        async def single_loader():
+            return "fresh"
+
+        assert await asyncio.wait_for(cache.get_or_load("a", single_loader), timeout=1) == "fresh"
+
+    asyncio.run(scenario())
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from ec_normalize import normalize_table, parse_number  # noqa: E402
+
+
+def test_parse_number_formats():
+    assert parse_number("1,23,456") == 123456
+    assert parse_number("123,456") == 123456
+    assert parse_number("१२,३४५") == 12345
+    assert parse_number("45.5%") == 45.5
+    assert parse_number("12,34") is None
+    assert parse_number("Nepali Congress") is None
+
+
+def test_parse_number_placeholders_are_empty():
+    for placeholder in ("", None, "-", "–", "—", "N/A", " n/a "):
+        assert parse_number(placeholder) is None
+
+
+def test_placeholders_keep_column_numeric():
+    headers = ["Candidate", "Votes", "Share"]
+    rows = [
+        ["A", "1,200", "55.5"],
+        ["B", "-", "—"],
+        ["C", "N/A", "–"],
+        ["D", "३००"],
+    ]
+    table = normalize_table(headers, rows)
+    assert [col["type"] for col in table["schema"]] == ["str", "int", "float"]
+    assert table["columns"][1] == [1200, None, None, 300]
+    assert table["columns"][2] == [55.5, None, None, None]
+
+
+def test_text_column_and_unnamed_headers():
+    table = normalize_table(["Party", ""], [["UML", "x"], ["", "12"]])
+    assert table["schema"] == [{"name": "Party", "type": "str"}, {"name": "column_1", "type": "str"}]
+    assert table["columns"] == [["UML", None], ["x", "12"]]
@@ -0,0 +1,37 @@
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+import server  # noqa: E402
+
+
+def _baseline_clean(description: str) -> str:
+    return re.sub('<[^<]+?>', '', description)[:200].strip()
+
+
+def test_clean_description_strips_long_inline_tag():
+    description = f'<img src="{"a" * 2100}"/> real text'
+    assert server._clean_description(description) == "real text"
+
+
+def test_clean_description_matches_full_strip():
+    description = "<p>" + "word <b>bold</b> " * 100 + "</p>" + "<i>tail</i>"
+    assert server._clean_description(description) == _baseline_clean(description)
+    assert server._clean_description("plain < 5 text") == _baseline_clean("plain < 5 text")
+    assert server._clean_description("") == ""
+
+
+def test_feed_parser_stops_after_max_items():
+    feed = {"id": "t", "name": "Test", "color": "#000"}
+    items = "".join(
+        f"<item><title>T{i}</title><link>http://x/{i}</link>"
+        f"<description>&lt;img src=\"{'a' * 2100}\"/&gt; text {i}</description></item>"
+        for i in range(20)
+    )
+    parser = server._FeedStreamParser(feed, max_items=3)
+    parser.feed_bytes(f"<rss><channel>{items}".encode())
+    assert parser.done
+    assert [a["title"] for a in parser.articles] == ["T0", "T1", "T2"]
+    assert parser.articles[0]["description"] == "text 0"